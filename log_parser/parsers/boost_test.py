@@ -12,6 +12,21 @@ class TestStatus(Enum):
     SKIPPED = "SKIPPED"
 
 
+_PASSED = TestStatus.PASSED.value
+_FAILED = TestStatus.FAILED.value
+
+
+# Failure and entering lines are collected in a single pass over the log,
+# dispatching on the named group that matched.
+_TEST_EVENT = re.compile(
+    r'(?i:error(?:\s+in)?\s+"(?P<failed>[^"]+)")'
+    r'|Entering test (?:case|suite) "(?P<entered>[^"]+)"'
+)
+_NO_ERRORS = re.compile(r'\*\*\* No errors detected')
+_TEST_COUNT = re.compile(r'(\d+)\s+test cases?\s+(?:out of \d+ )?passed', re.IGNORECASE)
+_FAILURE_SUMMARY = re.compile(r'\*\*\* (\d+) failure(?:s)? detected')
+
+
 def parse_log_boost_test(log: str) -> dict[str, str]:
     """
     Parser for test logs generated with Boost.Test.
@@ -26,28 +41,25 @@ def parse_log_boost_test(log: str) -> dict[str, str]:
     # Pattern for individual test failures
     # Example: "error: in "test_suite/test_case_name": check x == y has failed"
     # Example: "error in "test_suite/test_case_name": some error message"
-    failure_pattern = r'error(?:\s+in)?\s+"([^"]+)"'
-    
-    failed_tests = set()
-    for match in re.finditer(failure_pattern, log, re.IGNORECASE):
-        test_name = match.group(1)
-        failed_tests.add(test_name)
-        test_status_map[test_name] = TestStatus.FAILED.value
-
+    #
     # Pattern for entering/leaving test cases (to find all tests)
     # "Entering test case "test_name""
     # "Leaving test case "test_name""
-    entering_pattern = r'Entering test (?:case|suite) "([^"]+)"'
-    
-    all_tests = set()
-    for match in re.finditer(entering_pattern, log):
-        test_name = match.group(1)
-        all_tests.add(test_name)
+    #
+    # Until the loop below runs, test_status_map holds exactly the failed tests,
+    # so it doubles as the failed-name lookup. Entered names are kept in a dict
+    # (insertion-ordered, no values) so each name is stored once, in log order.
+    all_tests = {}
+    for match in _TEST_EVENT.finditer(log):
+        if match.lastgroup == "failed":
+            test_status_map[match.group("failed")] = _FAILED
+        else:
+            all_tests[match.group("entered")] = None
 
     # Mark all tests that weren't marked as failed as passed
     for test_name in all_tests:
-        if test_name not in failed_tests:
-            test_status_map[test_name] = TestStatus.PASSED.value
+        if test_name not in test_status_map:
+            test_status_map[test_name] = _PASSED
 
     # If we found individual tests, return them
     if test_status_map:
@@ -55,30 +67,30 @@ def parse_log_boost_test(log: str) -> dict[str, str]:
 
     # Fallback: Check for summary indicators
     # "*** No errors detected" means all tests passed
-    if re.search(r'\*\*\* No errors detected', log):
+    if "***" in log and _NO_ERRORS.search(log):
         # Try to extract test count from summary
         # "Test case ... passed"
         # "N test cases passed"
-        test_count_match = re.search(r'(\d+)\s+test cases?\s+(?:out of \d+ )?passed', log, re.IGNORECASE)
+        test_count_match = _TEST_COUNT.search(log)
         if test_count_match:
             passed = int(test_count_match.group(1))
             for i in range(passed):
-                test_status_map[f"test_passed_{i+1}"] = TestStatus.PASSED.value
+                test_status_map[f"test_passed_{i+1}"] = _PASSED
         elif not test_status_map:
             # If we see "No errors detected" but no count, mark as at least one passing test
-            test_status_map["boost_test_suite"] = TestStatus.PASSED.value
+            test_status_map["boost_test_suite"] = _PASSED
         return test_status_map
 
     # Check for failure summary
     # "*** N failure(s) detected"
-    failure_summary = re.search(r'\*\*\* (\d+) failure(?:s)? detected', log)
+    failure_summary = _FAILURE_SUMMARY.search(log) if "***" in log else None
     if failure_summary:
         failures = int(failure_summary.group(1))
         
         # If we already have specific failed tests from earlier parsing
-        if len([v for v in test_status_map.values() if v == TestStatus.FAILED.value]) == 0:
+        if len([v for v in test_status_map.values() if v == _FAILED]) == 0:
             # Create synthetic failure entries
             for i in range(failures):
-                test_status_map[f"test_failed_{i+1}"] = TestStatus.FAILED.value
+                test_status_map[f"test_failed_{i+1}"] = _FAILED
 
     return test_status_map
@@ -12,6 +12,12 @@ class TestStatus(Enum):
     SKIPPED = "SKIPPED"
 
 
+# "test test_function ... ok"
+_TEST = re.compile(r"^test\s+(\S+)\s+\.\.\.\s+(ok|FAILED|ignored)$")
+# "test src/lib.rs - function_name (line X) ... ok"
+_DOCTEST = re.compile(r"^test\s+\S+\s+-\s+(\w+)\s+.*\.\.\.\s+(ok|FAILED)$")
+
+
 def parse_log_cargo(log: str) -> dict[str, str]:
     """
     Parser for test logs generated with cargo test.
@@ -29,11 +35,9 @@ def parse_log_cargo(log: str) -> dict[str, str]:
     # "test test_function ... FAILED"
     # "test test_function ... ignored"
 
-    test_pattern = r"^test\s+(\S+)\s+\.\.\.\s+(ok|FAILED|ignored)$"
-
     for line in log.split("\n"):
         line = line.strip()
-        match = re.match(test_pattern, line)
+        match = _TEST.match(line)
         if match:
             test_name, status = match.groups()
 
@@ -47,11 +51,9 @@ def parse_log_cargo(log: str) -> dict[str, str]:
     # Alternative pattern for doctests
     # "   Doc-tests project_name"
     # "test src/lib.rs - function_name (line X) ... ok"
-    doctest_pattern = r"^test\s+\S+\s+-\s+(\w+)\s+.*\.\.\.\s+(ok|FAILED)$"
-
     for line in log.split("\n"):
         line = line.strip()
-        match = re.match(doctest_pattern, line)
+        match = _DOCTEST.match(line)
         if match:
             test_name, status = match.groups()
             test_name = f"doctest_{test_name}"
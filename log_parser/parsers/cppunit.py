@@ -2,9 +2,18 @@
 CppUnit test log parser for C++.
 """
 
+import heapq
 import re
 from enum import Enum
 
+from .utils import search_tail_first
+
+try:
+    # Optional linear-time engine for the hot patterns (pip install google-re2)
+    import re2 as _fast_re
+except ImportError:
+    _fast_re = re
+
 
 class TestStatus(Enum):
     PASSED = "PASSED"
@@ -12,6 +21,41 @@ class TestStatus(Enum):
     SKIPPED = "SKIPPED"
 
 
+_PASSED = TestStatus.PASSED.value
+_FAILED = TestStatus.FAILED.value
+
+
+# Failure markers are split by their leading token instead of a single
+# "(?:\d+\)|\*)" alternation so each pattern gets SRE's prefix fast path. The
+# nested name quantifier backtracks in SRE, so use re2 here when available.
+_NUMBERED_FAILURE = _fast_re.compile(r'\d+\)\s*(?:test|Test)(?:\s+name)?:\s*([\w:]+(?:::[\w]+)*)')
+_STARRED_FAILURE = _fast_re.compile(r'\*\s*(?:test|Test)(?:\s+name)?:\s*([\w:]+(?:::[\w]+)*)')
+_FAILURES_SECTION_ENTRY = re.compile(r'(?:Test name|test):\s*([\w:]+(?:::[\w]+)*)')
+_OK = re.compile(r'OK\s*\((\d+)\s+tests?\)', re.IGNORECASE)
+# An optional lazy "Test Results:.*?" prefix never changed the captured counts
+# (they always come from the first complete "Run:" line) but could rescan the
+# rest of the log from every "Test Results:" occurrence, so it is omitted.
+_SUMMARY = re.compile(
+    r'Run:\s*(\d+)\s+Failures:\s*(\d+)\s+Errors:\s*(\d+)', re.IGNORECASE
+)
+_FAILURE_COUNT = re.compile(r'There (?:were|was) (\d+) failures?', re.IGNORECASE)
+_ERROR_COUNT = re.compile(r'There (?:were|was) (\d+) errors?', re.IGNORECASE)
+
+
+def _iter_failures(log: str):
+    """Yield failure marker matches in log order, skipping overlaps like a single finditer."""
+    matches = _NUMBERED_FAILURE.finditer(log)
+    if "*" in log:
+        matches = heapq.merge(
+            matches, _STARRED_FAILURE.finditer(log), key=lambda m: m.start()
+        )
+    end = 0
+    for match in matches:
+        if match.start() >= end:
+            end = match.end()
+            yield match
+
+
 def parse_log_cppunit(log: str) -> dict[str, str]:
     """
     Parser for test logs generated with CppUnit.
@@ -26,43 +70,42 @@ def parse_log_cppunit(log: str) -> dict[str, str]:
     # Pattern for individual test failures
     # Example: "1) test: TestSuite::testMethod (F) line: 123 message"
     # Example: "Test name: TestSuite::testMethod"
-    failure_pattern = r'(?:\d+\)|\*)\s*(?:test|Test)(?:\s+name)?:\s*([\w:]+(?:::[\w]+)*)'
-    
     failed_tests = set()
-    for match in re.finditer(failure_pattern, log):
+    for match in _iter_failures(log):
         test_name = match.group(1)
         failed_tests.add(test_name)
-        test_status_map[test_name] = TestStatus.FAILED.value
+        test_status_map[test_name] = _FAILED
 
     # Check for failure indicators
     # "!!!FAILURES!!!" section typically lists failed tests
-    if "!!!FAILURES!!!" in log:
-        failures_section = log.split("!!!FAILURES!!!")[1] if "!!!" in log else ""
+    marker = log.find("!!!FAILURES!!!")
+    if marker != -1:
+        # Scan only up to the next marker, without copying the section out
+        start = marker + len("!!!FAILURES!!!")
+        end = log.find("!!!FAILURES!!!", start)
+        if end == -1:
+            end = len(log)
         # Extract test names from failures section
-        for match in re.finditer(r'(?:Test name|test):\s*([\w:]+(?:::[\w]+)*)', failures_section):
+        for match in _FAILURES_SECTION_ENTRY.finditer(log, start, end):
             test_name = match.group(1)
             if test_name not in test_status_map:
-                test_status_map[test_name] = TestStatus.FAILED.value
+                test_status_map[test_name] = _FAILED
 
     # Look for success summary
     # "OK (150 tests)"
     # "Tests run: 150"
-    ok_match = re.search(r'OK\s*\((\d+)\s+tests?\)', log, re.IGNORECASE)
+    ok_match = search_tail_first(_OK, log)
     if ok_match:
         passed = int(ok_match.group(1))
         # All tests passed
         for i in range(passed):
-            test_status_map[f"test_passed_{i+1}"] = TestStatus.PASSED.value
+            test_status_map[f"test_passed_{i+1}"] = _PASSED
         return test_status_map
 
     # Alternative summary format
     # "Test Results:"
     # "Run: 150  Failures: 2  Errors: 0"
-    summary_match = re.search(
-        r'(?:Test Results:.*?)?Run:\s*(\d+)\s+Failures:\s*(\d+)\s+Errors:\s*(\d+)',
-        log,
-        re.DOTALL | re.IGNORECASE
-    )
+    summary_match = _SUMMARY.search(log)
     if summary_match:
         total = int(summary_match.group(1))
         failures = int(summary_match.group(2))
@@ -73,15 +116,15 @@ def parse_log_cppunit(log: str) -> dict[str, str]:
         # If we don't have specific test names, create synthetic entries
         if not test_status_map:
             for i in range(passed):
-                test_status_map[f"test_passed_{i+1}"] = TestStatus.PASSED.value
+                test_status_map[f"test_passed_{i+1}"] = _PASSED
             for i in range(failures + errors):
-                test_status_map[f"test_failed_{i+1}"] = TestStatus.FAILED.value
+                test_status_map[f"test_failed_{i+1}"] = _FAILED
         else:
             # We have some specific failures, fill in the rest as passes
-            specific_failures = len([v for v in test_status_map.values() if v == TestStatus.FAILED.value])
+            specific_failures = len([v for v in test_status_map.values() if v == _FAILED])
             remaining_passes = total - specific_failures
             for i in range(remaining_passes):
-                test_status_map[f"test_passed_{i+1}"] = TestStatus.PASSED.value
+                test_status_map[f"test_passed_{i+1}"] = _PASSED
 
         return test_status_map
 
@@ -91,14 +134,14 @@ def parse_log_cppunit(log: str) -> dict[str, str]:
 
     # Last fallback: Check if there's any indication of tests
     # "There were N failures:" or "There were N errors:"
-    failure_count = re.search(r'There (?:were|was) (\d+) failures?', log, re.IGNORECASE)
-    error_count = re.search(r'There (?:were|was) (\d+) errors?', log, re.IGNORECASE)
+    failure_count = _FAILURE_COUNT.search(log)
+    error_count = _ERROR_COUNT.search(log)
     
     if failure_count or error_count:
         failures = int(failure_count.group(1)) if failure_count else 0
         errors = int(error_count.group(1)) if error_count else 0
         
         for i in range(failures + errors):
-            test_status_map[f"test_failed_{i+1}"] = TestStatus.FAILED.value
+            test_status_map[f"test_failed_{i+1}"] = _FAILED
 
     return test_status_map
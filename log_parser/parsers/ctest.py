@@ -6,26 +6,32 @@ class TestStatus(Enum):
     FAILED = "FAILED"
     SKIPPED = "SKIPPED"
 
+# Pattern for CTest output: " 47/70 Test #47: brpc_load_balancer_unittest .................   Passed  173.42 sec"
+_CTEST_LINE = re.compile(r'\s*\d+/\d+\s+Test\s+#\d+:\s+([\w\-/.]+)\s+\.+\s+(Passed|Failed)', re.IGNORECASE)
+_CTEST_STATUS = {"passed": "PASSED", "failed": "FAILED"}
+_FAILED_SECTION = re.compile(r'The following tests FAILED:\n((?:\s+\d+\s+-\s+[\w\-/.]+.*\n?)+)')
+_FAILED_ENTRY = re.compile(r'\d+\s+-\s+([\w\-/.]+)')
+_SUMMARY = re.compile(r'(\d+)%\s+tests\s+passed,\s+(\d+)\s+tests\s+failed\s+out\s+of\s+(\d+)', re.IGNORECASE)
+
 def parse_log_ctest(log: str) -> dict[str, str]:
     results = {}
-    # Pattern for CTest output: " 47/70 Test #47: brpc_load_balancer_unittest .................   Passed  173.42 sec"
-    ctest_pattern = re.compile(r'\s*\d+/\d+\s+Test\s+#\d+:\s+([\w\-/.]+)\s+\.+\s+(Passed|Failed)', re.IGNORECASE)
-    for match in ctest_pattern.finditer(log):
+    for match in _CTEST_LINE.finditer(log):
         test_name = match.group(1)
-        status = "PASSED" if match.group(2).lower() == "passed" else "FAILED"
-        results[test_name] = status
+        results[test_name] = _CTEST_STATUS.get(match.group(2).lower(), "FAILED")
     
     # Fallback/complement: "The following tests FAILED:" section
-    failed_section = re.search(r'The following tests FAILED:\n((?:\s+\d+\s+-\s+[\w\-/.]+.*\n?)+)', log)
+    failed_section = (
+        _FAILED_SECTION.search(log) if "The following tests FAILED:" in log else None
+    )
     if failed_section:
         for line in failed_section.group(1).splitlines():
-            m = re.search(r'\d+\s+-\s+([\w\-/.]+)', line)
+            m = _FAILED_ENTRY.search(line)
             if m:
                 results[m.group(1)] = "FAILED"
     
     # If no individual tests found, try summary
     if not results:
-        summary_match = re.search(r'(\d+)%\s+tests\s+passed,\s+(\d+)\s+tests\s+failed\s+out\s+of\s+(\d+)', log, re.IGNORECASE)
+        summary_match = _SUMMARY.search(log)
         if summary_match:
             total = int(summary_match.group(3))
             failed = int(summary_match.group(2))
@@ -12,6 +12,14 @@ class TestStatus(Enum):
     SKIPPED = "SKIPPED"
 
 
+# "--- PASS: TestFunction (0.00s)"
+_RESULT = re.compile(r"^---\s+(PASS|FAIL|SKIP):\s+(\w+)(?:\s+\([\d\.]+s\))?.*$")
+# "    --- PASS: TestFunction/subtest (0.00s)"
+_SUBTEST = re.compile(
+    r"^\s+---\s+(PASS|FAIL|SKIP):\s+(\w+/[\w/]+)(?:\s+\([\d\.]+s\))?.*$"
+)
+
+
 def parse_log_go_test(log: str) -> dict[str, str]:
     """
     Parser for test logs generated with Go test.
@@ -30,11 +38,9 @@ def parse_log_go_test(log: str) -> dict[str, str]:
     # "--- FAIL: TestFunction (0.00s)"
     # "--- SKIP: TestFunction (0.00s)"
 
-    result_pattern = r"^---\s+(PASS|FAIL|SKIP):\s+(\w+)(?:\s+\([\d\.]+s\))?.*$"
-
     for line in log.split("\n"):
         line = line.strip()
-        match = re.match(result_pattern, line)
+        match = _RESULT.match(line)
         if match:
             status, test_name = match.groups()
 
@@ -47,13 +53,9 @@ def parse_log_go_test(log: str) -> dict[str, str]:
 
     # Alternative pattern for table tests or subtests
     # "    --- PASS: TestFunction/subtest (0.00s)"
-    subtest_pattern = (
-        r"^\s+---\s+(PASS|FAIL|SKIP):\s+(\w+/[\w/]+)(?:\s+\([\d\.]+s\))?.*$"
-    )
-
     for line in log.split("\n"):
         line_stripped = line.strip()
-        match = re.match(subtest_pattern, line)
+        match = _SUBTEST.match(line)
         if match:
             status, test_name = match.groups()
             # Clean up the subtest name
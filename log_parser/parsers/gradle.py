@@ -14,6 +14,18 @@ class TestStatus(Enum):
     SKIPPED = "SKIPPED"
 
 
+_XML_SUITE = re.compile(r"<\?xml version.*?</testsuite>", re.DOTALL)
+_ANSI = re.compile(r"\x1b\[[0-9;]*m")
+# "org.kse.crypto.x509.X509CertUtilTest > testConvertCertificate PASSED"
+_CONSOLE_STATUS = re.compile(
+    r"^(.+?)\s+>\s+(\w+(?:\[[\d\w]+\])?)\s+(PASSED|FAILED|SKIPPED)$"
+)
+# Mocha-style summary counts: "2217 passing (1m 30s)", "75 pending"
+_PASSING = re.compile(r"^\s*(\d+)\s+passing")
+_PENDING = re.compile(r"^\s*(\d+)\s+pending")
+_FAILING = re.compile(r"^\s*(\d+)\s+failing")
+
+
 def parse_log_gradle(log: str) -> dict[str, str]:
     """
     Parser for test logs generated with Gradle.
@@ -31,7 +43,7 @@ def parse_log_gradle(log: str) -> dict[str, str]:
 
     # First, try to parse JUnit XML format (most reliable)
     # Extract all XML content from the log
-    xml_matches = re.findall(r"<\?xml version.*?</testsuite>", log, re.DOTALL)
+    xml_matches = _XML_SUITE.findall(log)
 
     if xml_matches:
         for xml_content in xml_matches:
@@ -66,8 +78,6 @@ def parse_log_gradle(log: str) -> dict[str, str]:
 
     # Fallback: Pattern 1 - Standard Gradle console output
     # "org.kse.crypto.x509.X509CertUtilTest > testConvertCertificate PASSED"
-    standard_pattern = r"^(.+?)\s+>\s+(\w+(?:\[[\d\w]+\])?)\s+(PASSED|FAILED|SKIPPED)$"
-
     # Also track tests that appear in the log (for summary generation)
     all_test_names = set()
 
@@ -75,9 +85,9 @@ def parse_log_gradle(log: str) -> dict[str, str]:
         line = line.strip()
 
         # Strip ANSI color codes
-        cleaned_line = re.sub(r"\x1b\[[0-9;]*m", "", line)
+        cleaned_line = _ANSI.sub("", line)
 
-        match = re.match(standard_pattern, cleaned_line)
+        match = _CONSOLE_STATUS.match(cleaned_line)
         if match:
             class_name, method_name, status = match.groups()
             test_name = f"{class_name}.{method_name}"
@@ -97,20 +107,16 @@ def parse_log_gradle(log: str) -> dict[str, str]:
     # Pattern 2: Mocha-style summary (used by some Gradle configurations)
     # "2217 passing (1m 30s)"
     # "75 pending"
-    summary_pattern_passing = r"^\s*(\d+)\s+passing"
-    summary_pattern_pending = r"^\s*(\d+)\s+pending"
-    summary_pattern_failing = r"^\s*(\d+)\s+failing"
-
     passing_count = 0
     pending_count = 0
     failing_count = 0
 
     for line in log.split("\n"):
-        cleaned_line = re.sub(r"\x1b\[[0-9;]*m", "", line.strip())
+        cleaned_line = _ANSI.sub("", line.strip())
 
-        match_pass = re.match(summary_pattern_passing, cleaned_line)
-        match_pend = re.match(summary_pattern_pending, cleaned_line)
-        match_fail = re.match(summary_pattern_failing, cleaned_line)
+        match_pass = _PASSING.match(cleaned_line)
+        match_pend = _PENDING.match(cleaned_line)
+        match_fail = _FAILING.match(cleaned_line)
 
         if match_pass:
             passing_count = int(match_pass.group(1))
@@ -2,9 +2,19 @@
 Google Test (gtest) log parser for C++.
 """
 
+import mmap
+import os
 import re
 from enum import Enum
 
+from .utils import search_tail_first
+
+try:
+    # Optional linear-time engine for the hot patterns (pip install google-re2)
+    import re2 as _fast_re
+except ImportError:
+    _fast_re = re
+
 
 class TestStatus(Enum):
     PASSED = "PASSED"
@@ -12,6 +22,34 @@ class TestStatus(Enum):
     SKIPPED = "SKIPPED"
 
 
+# Status strings hoisted out of the per-test loops (avoids Enum .value lookups)
+_PASSED = TestStatus.PASSED.value
+_FAILED = TestStatus.FAILED.value
+_SKIPPED = TestStatus.SKIPPED.value
+
+
+# Result lines, matched across the whole log in one pass. "[^\S\n]" keeps every
+# whitespace run on a single line, mirroring the former per-line matching.
+# Examples:
+# "[       OK ] TestSuite.TestName (123 ms)"
+# "[  FAILED  ] TestSuite.TestName (456 ms)"
+# "[  PASSED  ] 150 tests."
+# "[  SKIPPED ] TestSuite.TestName"
+# Flags are inline because re2 takes no re-style flags argument.
+_RESULT_LINE_PATTERN = (
+    r'(?m)^[^\S\n]*\[[^\S\n]*(OK|PASSED|FAILED|SKIPPED|DISABLED)[^\S\n]*\]'
+    r'[^\S\n]+([\w:/.]+)([^\S\n]+\(|[^\S\n]*$)?'
+)
+_RESULT_LINE = _fast_re.compile(_RESULT_LINE_PATTERN)
+# Byte-level twin used by parse_log_gtest_bytes; \w and \s match ASCII only.
+_RESULT_LINE_BYTES = re.compile(_RESULT_LINE_PATTERN.encode())
+
+# Summary patterns
+_SUMMARY_TESTS = re.compile(r'\[\s*=+\s*\]\s*(\d+)\s+tests?\s+from')
+_SUMMARY_PASSED = re.compile(r'\[\s*PASSED\s*\]\s*(\d+)\s+tests?')
+_SUMMARY_FAILED = re.compile(r'\[\s*FAILED\s*\]\s*(\d+)\s+tests?')
+
+
 def parse_log_gtest(log: str) -> dict[str, str]:
     """
     Parser for test logs generated with Google Test.
@@ -22,50 +60,22 @@ def parse_log_gtest(log: str) -> dict[str, str]:
         dict: test case to test status mapping
     """
     test_status_map = {}
-    current_test = None
-
-    # Pattern for individual test results
-    # Examples:
-    # "[       OK ] TestSuite.TestName (123 ms)"
-    # "[  FAILED  ] TestSuite.TestName (456 ms)"
-    # "[ RUN      ] TestSuite.TestName"
-    # "[  PASSED  ] 150 tests."
-    # "[  SKIPPED ] TestSuite.TestName"
-
-    for line in log.split("\n"):
-        line = line.strip()
-
-        # Match RUN lines to capture test name
-        run_match = re.match(r'\[\s*RUN\s*\]\s+([\w:/.]+)', line)
-        if run_match:
-            current_test = run_match.group(1)
-            continue
-
-        # Match OK/PASSED result lines
-        ok_match = re.match(r'\[\s*(OK|PASSED)\s*\]\s+([\w:/.]+)', line)
-        if ok_match:
-            test_name = ok_match.group(2)
-            test_status_map[test_name] = TestStatus.PASSED.value
-            current_test = None
-            continue
-
-        # Match FAILED result lines (but not summary lines with "tests")
-        failed_match = re.match(r'\[\s*FAILED\s*\]\s+([\w:/.]+)(?:\s+\(|$)', line)
-        if failed_match:
-            test_name = failed_match.group(1)
-            # Avoid matching summary lines like "[  FAILED  ] 2 tests"
-            if not test_name.isdigit():
-                test_status_map[test_name] = TestStatus.FAILED.value
-            current_test = None
-            continue
-
-        # Match SKIPPED/DISABLED result lines
-        skip_match = re.match(r'\[\s*(SKIPPED|DISABLED)\s*\]\s+([\w:/.]+)', line)
-        if skip_match:
-            test_name = skip_match.group(2)
-            test_status_map[test_name] = TestStatus.SKIPPED.value
-            current_test = None
-            continue
+
+    # The scan cannot stop once the "Running N tests" count is reached: later
+    # lines still overwrite results (--gtest_repeat, several binaries in one
+    # log) and the "[  PASSED  ] N tests." footer adds an entry of its own.
+    for match in _RESULT_LINE.finditer(log):
+        status, test_name, tail = match.groups()
+
+        if status == "OK" or status == "PASSED":
+            test_status_map[test_name] = _PASSED
+        elif status == "FAILED":
+            # Only "<name> (" or "<name>" at end of line; avoid summary lines
+            # like "[  FAILED  ] 2 tests"
+            if tail is not None and not test_name.isdigit():
+                test_status_map[test_name] = _FAILED
+        else:
+            test_status_map[test_name] = _SKIPPED
 
     # Fallback: Try to parse summary lines if no individual tests found
     if test_status_map:
@@ -73,9 +83,9 @@ def parse_log_gtest(log: str) -> dict[str, str]:
     # "[==========] 150 tests from 25 test suites ran."
     # "[  PASSED  ] 149 tests."
     # "[  FAILED  ] 1 test, listed below:"
-    summary_tests = re.search(r'\[\s*=+\s*\]\s*(\d+)\s+tests?\s+from', log)
-    summary_passed = re.search(r'\[\s*PASSED\s*\]\s*(\d+)\s+tests?', log)
-    summary_failed = re.search(r'\[\s*FAILED\s*\]\s*(\d+)\s+tests?', log)
+    summary_tests = search_tail_first(_SUMMARY_TESTS, log)
+    summary_passed = search_tail_first(_SUMMARY_PASSED, log)
+    summary_failed = search_tail_first(_SUMMARY_FAILED, log)
 
     if summary_tests:
         total_tests = int(summary_tests.group(1))
@@ -84,8 +94,60 @@ def parse_log_gtest(log: str) -> dict[str, str]:
 
         # Create synthetic test entries
         for i in range(passed_tests):
-            test_status_map[f"test_passed_{i+1}"] = TestStatus.PASSED.value
+            test_status_map[f"test_passed_{i+1}"] = _PASSED
         for i in range(failed_tests):
-            test_status_map[f"test_failed_{i+1}"] = TestStatus.FAILED.value
+            test_status_map[f"test_failed_{i+1}"] = _FAILED
 
     return test_status_map
+
+
+def parse_log_gtest_bytes(log) -> dict[str, str]:
+    """
+    Parser for Google Test logs passed as raw bytes.
+
+    Result lines are matched on the undecoded buffer and only the captured
+    test names are decoded. Logs without result lines are decoded once and
+    handed to parse_log_gtest for the summary fallback.
+
+    Args:
+        log (bytes-like): raw log content, e.g. bytes or an mmap
+    Returns:
+        dict: test case to test status mapping
+    """
+    test_status_map = {}
+
+    for match in _RESULT_LINE_BYTES.finditer(log):
+        status, test_name, tail = match.groups()
+        test_name = test_name.decode("ascii")
+
+        if status == b"OK" or status == b"PASSED":
+            test_status_map[test_name] = _PASSED
+        elif status == b"FAILED":
+            if tail is not None and not test_name.isdigit():
+                test_status_map[test_name] = _FAILED
+        else:
+            test_status_map[test_name] = _SKIPPED
+
+    if test_status_map:
+        return test_status_map
+    return parse_log_gtest(bytes(log).decode("utf-8", errors="replace"))
+
+
+def parse_log_gtest_path(path) -> dict[str, str]:
+    """
+    Parser for a Google Test log file, scanned through a read-only mmap.
+
+    The file is never copied into a str; pages are faulted in only as the
+    result-line scan reaches them.
+
+    Args:
+        path: path to the log file
+    Returns:
+        dict: test case to test status mapping
+    """
+    with open(path, "rb") as f:
+        # mmap cannot map an empty file
+        if os.fstat(f.fileno()).st_size == 0:
+            return parse_log_gtest("")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return parse_log_gtest_bytes(mm)
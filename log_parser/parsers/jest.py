@@ -12,6 +12,16 @@ class TestStatus(Enum):
     SKIPPED = "SKIPPED"
 
 
+# Verbose per-test lines with checkmarks/crosses
+_TEST_LINE = re.compile(r"^\s*(✓|✕|○)\s(.+?)(?:\s\((\d+\s*m?s)\))?$")
+# "PASS/FAIL filename" or "PASS/FAIL test description"
+_FILE_SUMMARY = re.compile(r"^\s*(PASS|FAIL|SKIP)\s+(.+?)(?:\s\((\d+\.\d+\s*s?)\))?$")
+# "Tests:       1992 passed, 1992 total"
+_TOTALS = re.compile(
+    r"Tests:\s+(\d+)\s+passed(?:,\s+(\d+)\s+failed)?(?:,\s+(\d+)\s+skipped)?(?:,\s+(\d+)\s+total)?"
+)
+
+
 def parse_log_jest(log: str) -> dict[str, str]:
     """
     Parser for test logs generated with Jest. Assumes --verbose flag.
@@ -23,11 +33,9 @@ def parse_log_jest(log: str) -> dict[str, str]:
     """
     test_status_map = {}
 
-    # Pattern for Jest verbose output with checkmarks/crosses
-    pattern = r"^\s*(✓|✕|○)\s(.+?)(?:\s\((\d+\s*m?s)\))?$"
-
+    # Jest verbose output with checkmarks/crosses
     for line in log.split("\n"):
-        match = re.match(pattern, line.strip())
+        match = _TEST_LINE.match(line.strip())
         if match:
             status_symbol, test_name, _duration = match.groups()
             if status_symbol == "✓":
@@ -39,10 +47,8 @@ def parse_log_jest(log: str) -> dict[str, str]:
 
     # Alternative pattern for Jest summary format
     if not test_status_map:
-        # Pattern for "PASS/FAIL filename" or "PASS/FAIL test description"
-        summary_pattern = r"^\s*(PASS|FAIL|SKIP)\s+(.+?)(?:\s\((\d+\.\d+\s*s?)\))?$"
         for line in log.split("\n"):
-            match = re.match(summary_pattern, line.strip())
+            match = _FILE_SUMMARY.match(line.strip())
             if match:
                 status, test_name, _duration = match.groups()
                 if status == "PASS":
@@ -53,11 +59,8 @@ def parse_log_jest(log: str) -> dict[str, str]:
                     test_status_map[test_name] = TestStatus.SKIPPED.value
 
     # Check Jest summary line and supplement if needed
-    # Pattern: "Tests:       1992 passed, 1992 total"
-    summary_line_pattern = r"Tests:\s+(\d+)\s+passed(?:,\s+(\d+)\s+failed)?(?:,\s+(\d+)\s+skipped)?(?:,\s+(\d+)\s+total)?"
-
     for line in log.split("\n"):
-        match = re.search(summary_line_pattern, line)
+        match = _TOTALS.search(line)
         if match:
             passed_count = int(match.group(1)) if match.group(1) else 0
             failed_count = int(match.group(2)) if match.group(2) else 0
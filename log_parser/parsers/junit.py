@@ -6,6 +6,8 @@ Parses test output from Apache Ant JUnit task.
 import re
 from enum import Enum
 
+from .utils import decimal_strings
+
 
 class TestStatus(Enum):
     PASSED = "PASSED"
@@ -13,6 +15,16 @@ class TestStatus(Enum):
     SKIPPED = "SKIPPED"
 
 
+# Per-line Ant patterns, compiled once and gated on cheap literal checks below.
+_LOG_PREFIX = re.compile(r"^\[[^\]]+\]\s+")
+_RUNNING = re.compile(r"^Running\s+(.+)$")
+_SUMMARY = re.compile(
+    r"^Tests run:\s+(\d+),\s+Failures:\s+(\d+),\s+Errors:\s+(\d+),\s+Skipped:\s+(\d+)"
+)
+# Fallback: "testMethodName(com.example.TestClass): FAILED"
+_METHOD_STATUS = re.compile(r"^(\w+)\(([^)]+)\):\s*(PASSED|FAILED|ERROR|SKIPPED)$")
+
+
 def parse_log_junit(log: str) -> dict[str, str]:
     """
     Parser for test logs generated with JUnit via Apache Ant.
@@ -29,20 +41,23 @@ def parse_log_junit(log: str) -> dict[str, str]:
         line = line.strip()
 
         # Strip common Ant log prefixes like [test], [junit], etc.
-        cleaned_line = re.sub(r"^\[[^\]]+\]\s+", "", line)
+        cleaned_line = _LOG_PREFIX.sub("", line) if line.startswith("[") else line
 
         # Track current test class
         # Example: "Running com.gitblit.StoredUserConfigTest"
-        class_match = re.match(r"^Running\s+(.+)$", cleaned_line)
+        class_match = (
+            _RUNNING.match(cleaned_line) if cleaned_line.startswith("Running") else None
+        )
         if class_match:
             current_class = class_match.group(1)
             continue
 
         # Parse test summary lines (class-level)
         # Example: "Tests run: 7, Failures: 0, Errors: 0, Skipped: 0, Time elapsed: 0.173 sec"
-        summary_match = re.match(
-            r"^Tests run:\s+(\d+),\s+Failures:\s+(\d+),\s+Errors:\s+(\d+),\s+Skipped:\s+(\d+)",
-            cleaned_line,
+        summary_match = (
+            _SUMMARY.match(cleaned_line)
+            if cleaned_line.startswith("Tests run:")
+            else None
         )
         if summary_match:
             tests_run = int(summary_match.group(1))
@@ -51,35 +66,28 @@ def parse_log_junit(log: str) -> dict[str, str]:
             skipped = int(summary_match.group(4))
 
             if current_class:
+                prefix = current_class + ".test_"
                 # Create entries for each test in the class
                 # If we have failures/errors, mark them as failed
                 # If we have skipped tests, create separate entries
                 if failures > 0 or errors > 0:
-                    for i in range(failures + errors):
-                        test_status_map[f"{current_class}.test_{i + 1}"] = (
-                            TestStatus.FAILED.value
-                        )
+                    for num in decimal_strings(1, failures + errors + 1):
+                        test_status_map[prefix + num] = TestStatus.FAILED.value
                     # Add passed tests
-                    for i in range(tests_run - failures - errors - skipped):
-                        test_status_map[
-                            f"{current_class}.test_{failures + errors + i + 1}"
-                        ] = TestStatus.PASSED.value
+                    for num in decimal_strings(
+                        failures + errors + 1, tests_run - skipped + 1
+                    ):
+                        test_status_map[prefix + num] = TestStatus.PASSED.value
                     # Add skipped tests
-                    for i in range(skipped):
-                        test_status_map[
-                            f"{current_class}.test_{tests_run - skipped + i + 1}"
-                        ] = TestStatus.SKIPPED.value
+                    for num in decimal_strings(tests_run - skipped + 1, tests_run + 1):
+                        test_status_map[prefix + num] = TestStatus.SKIPPED.value
                 else:
                     # All tests passed (minus skipped)
-                    for i in range(tests_run - skipped):
-                        test_status_map[f"{current_class}.test_{i + 1}"] = (
-                            TestStatus.PASSED.value
-                        )
+                    for num in decimal_strings(1, tests_run - skipped + 1):
+                        test_status_map[prefix + num] = TestStatus.PASSED.value
                     # Add skipped tests
-                    for i in range(skipped):
-                        test_status_map[
-                            f"{current_class}.test_{tests_run - skipped + i + 1}"
-                        ] = TestStatus.SKIPPED.value
+                    for num in decimal_strings(tests_run - skipped + 1, tests_run + 1):
+                        test_status_map[prefix + num] = TestStatus.SKIPPED.value
             continue
 
     # Alternative: Try to parse individual test method output if available
@@ -87,12 +95,10 @@ def parse_log_junit(log: str) -> dict[str, str]:
     if not test_status_map:
         # Pattern for individual test methods with status
         # Example: "testMethodName(com.example.TestClass): FAILED"
-        method_pattern = r"^(\w+)\(([^)]+)\):\s*(PASSED|FAILED|ERROR|SKIPPED)$"
-
         for line in log.split("\n"):
-            cleaned_line = re.sub(r"^\[[^\]]+\]\s+", "", line.strip())
+            cleaned_line = _LOG_PREFIX.sub("", line.strip())
 
-            match = re.match(method_pattern, cleaned_line)
+            match = _METHOD_STATUS.match(cleaned_line)
             if match:
                 method_name, class_name, status = match.groups()
                 test_name = f"{class_name}.{method_name}"
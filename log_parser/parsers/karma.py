@@ -12,6 +12,12 @@ class TestStatus(Enum):
     SKIPPED = "SKIPPED"
 
 
+# Karma final summary: "Executed 108 of 108 SUCCESS" or "Executed 100 of 108 (8 FAILED)"
+_SUCCESS = re.compile(r"Executed\s+(\d+)\s+of\s+\d+\s+SUCCESS")
+_FAILED = re.compile(r"Executed\s+\d+\s+of\s+\d+\s+\((\d+)\s+FAILED\)")
+_SKIPPED = re.compile(r"Executed\s+\d+\s+of\s+(\d+)\s+\((\d+)\s+skipped\)")
+
+
 def parse_log_karma(log: str) -> dict[str, str]:
     """
     Parser for test logs generated by Karma (Jasmine runner).
@@ -30,12 +36,6 @@ def parse_log_karma(log: str) -> dict[str, str]:
     """
     test_status_map = {}
 
-    # Pattern for Karma final summary
-    # Matches: "Executed 108 of 108 SUCCESS" or "Executed 100 of 108 (8 FAILED)"
-    success_pattern = r"Executed\s+(\d+)\s+of\s+\d+\s+SUCCESS"
-    failed_pattern = r"Executed\s+\d+\s+of\s+\d+\s+\((\d+)\s+FAILED\)"
-    skipped_pattern = r"Executed\s+\d+\s+of\s+(\d+)\s+\((\d+)\s+skipped\)"
-
     # Look for the final summary line
     passed_count = 0
     failed_count = 0
@@ -43,17 +43,17 @@ def parse_log_karma(log: str) -> dict[str, str]:
 
     for line in log.split("\n"):
         # Check for success pattern
-        success_match = re.search(success_pattern, line)
+        success_match = _SUCCESS.search(line)
         if success_match:
             passed_count = max(passed_count, int(success_match.group(1)))
 
         # Check for failed pattern
-        failed_match = re.search(failed_pattern, line)
+        failed_match = _FAILED.search(line)
         if failed_match:
             failed_count = max(failed_count, int(failed_match.group(1)))
 
         # Check for skipped pattern
-        skipped_match = re.search(skipped_pattern, line)
+        skipped_match = _SKIPPED.search(line)
         if skipped_match:
             skipped_count = max(skipped_count, int(skipped_match.group(2)))
 
@@ -16,6 +16,10 @@ class TestStatus(Enum):
     SKIPPED = "SKIPPED"
 
 
+# lodash's custom test format: "PASS: 6800  FAIL: 0  TOTAL: 6800"
+_SUITE_SUMMARY = re.compile(r"PASS:\s*(\d+)\s+FAIL:\s*(\d+)\s+TOTAL:\s*(\d+)")
+
+
 def parse_log_lodash_custom(log: str) -> dict[str, str]:
     """
     Parser for test logs generated by lodash's custom test runner.
@@ -31,14 +35,10 @@ def parse_log_lodash_custom(log: str) -> dict[str, str]:
     """
     test_status_map = {}
 
-    # Pattern for lodash's custom test format
-    # Matches: "PASS: 6800  FAIL: 0  TOTAL: 6800"
-    pattern = r"PASS:\s*(\d+)\s+FAIL:\s*(\d+)\s+TOTAL:\s*(\d+)"
-
     test_suite_count = 0
 
     for line in log.split("\n"):
-        match = re.search(pattern, line.strip())
+        match = _SUITE_SUMMARY.search(line.strip())
         if match:
             pass_count = int(match.group(1))
             fail_count = int(match.group(2))
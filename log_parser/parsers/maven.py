@@ -5,6 +5,8 @@ Maven/Gradle test log parser for Java.
 import re
 from enum import Enum
 
+from .utils import decimal_strings
+
 
 class TestStatus(Enum):
     PASSED = "PASSED"
@@ -12,6 +14,20 @@ class TestStatus(Enum):
     SKIPPED = "SKIPPED"
 
 
+# Per-line Surefire patterns, compiled once and gated on cheap literal checks below.
+_LOG_PREFIX = re.compile(r"^\[(INFO|DEBUG|WARNING|ERROR)\]\s+")
+_RUNNING = re.compile(r"^Running\s+(.+)$")
+_SUMMARY = re.compile(
+    r"^Tests run:\s+(\d+),\s+Failures:\s+(\d+),\s+Errors:\s+(\d+),\s+Skipped:\s+(\d+).*?(?:--\s+in\s+(.+))?$"
+)
+_METHOD = re.compile(
+    r"^(\w+)\([^)]+\)\s+Time elapsed:.*?(?:<<<\s+(FAILURE|ERROR)!)?$"
+)
+# Fallbacks when no Surefire output was found
+_JUNIT_STATUS = re.compile(r"^\s*(PASS|FAIL|SKIP).*?(\w+\.\w+).*$")
+_GRADLE_STATUS = re.compile(r"^(.+?)\s+>\s+(\w+)\s+(PASSED|FAILED|SKIPPED)$")
+
+
 def parse_log_maven(log: str) -> dict[str, str]:
     """
     Parser for test logs generated with Maven or Gradle.
@@ -31,7 +47,6 @@ def parse_log_maven(log: str) -> dict[str, str]:
     # First, look for individual test methods in verbose output
     # "testMethodName(com.example.TestClass)  Time elapsed: 0.001 sec"
     # "testMethodName(com.example.TestClass)  Time elapsed: 0.001 sec  <<< FAILURE!"
-    method_pattern = r"^(\w+)\([^)]+\)\s+Time elapsed:.*?(?:<<<\s+(FAILURE|ERROR)!)?$"
 
     current_class = None
 
@@ -39,19 +54,22 @@ def parse_log_maven(log: str) -> dict[str, str]:
         line = line.strip()
 
         # Strip common Maven log prefixes like [INFO], [DEBUG], [WARNING], [ERROR]
-        cleaned_line = re.sub(r"^\[(INFO|DEBUG|WARNING|ERROR)\]\s+", "", line)
+        cleaned_line = _LOG_PREFIX.sub("", line) if line.startswith("[") else line
 
         # Track current test class
-        class_match = re.match(r"^Running\s+(.+)$", cleaned_line)
+        class_match = (
+            _RUNNING.match(cleaned_line) if cleaned_line.startswith("Running") else None
+        )
         if class_match:
             current_class = class_match.group(1)
             continue
 
         # Parse test summary lines (class-level)
         # Example: "Tests run: 2, Failures: 0, Errors: 0, Skipped: 0, Time elapsed: 0.416 s -- in io.github.classgraph.features.EnumTest"
-        summary_match = re.match(
-            r"^Tests run:\s+(\d+),\s+Failures:\s+(\d+),\s+Errors:\s+(\d+),\s+Skipped:\s+(\d+).*?(?:--\s+in\s+(.+))?$",
-            cleaned_line,
+        summary_match = (
+            _SUMMARY.match(cleaned_line)
+            if cleaned_line.startswith("Tests run:")
+            else None
         )
         if summary_match:
             tests_run = int(summary_match.group(1))
@@ -63,39 +81,34 @@ def parse_log_maven(log: str) -> dict[str, str]:
             )
 
             if test_class:
+                prefix = test_class + ".test_"
                 # Create entries for each test in the class
                 # If we have failures/errors, mark the class as failed
                 # If we have skipped tests, create separate entries
                 if failures > 0 or errors > 0:
-                    for i in range(failures + errors):
-                        test_status_map[f"{test_class}.test_{i + 1}"] = (
-                            TestStatus.FAILED.value
-                        )
+                    for num in decimal_strings(1, failures + errors + 1):
+                        test_status_map[prefix + num] = TestStatus.FAILED.value
                     # Add passed tests
-                    for i in range(tests_run - failures - errors - skipped):
-                        test_status_map[
-                            f"{test_class}.test_{failures + errors + i + 1}"
-                        ] = TestStatus.PASSED.value
+                    for num in decimal_strings(
+                        failures + errors + 1, tests_run - skipped + 1
+                    ):
+                        test_status_map[prefix + num] = TestStatus.PASSED.value
                     # Add skipped tests
-                    for i in range(skipped):
-                        test_status_map[
-                            f"{test_class}.test_{tests_run - skipped + i + 1}"
-                        ] = TestStatus.SKIPPED.value
+                    for num in decimal_strings(tests_run - skipped + 1, tests_run + 1):
+                        test_status_map[prefix + num] = TestStatus.SKIPPED.value
                 else:
                     # All tests passed (minus skipped)
-                    for i in range(tests_run - skipped):
-                        test_status_map[f"{test_class}.test_{i + 1}"] = (
-                            TestStatus.PASSED.value
-                        )
+                    for num in decimal_strings(1, tests_run - skipped + 1):
+                        test_status_map[prefix + num] = TestStatus.PASSED.value
                     # Add skipped tests
-                    for i in range(skipped):
-                        test_status_map[
-                            f"{test_class}.test_{tests_run - skipped + i + 1}"
-                        ] = TestStatus.SKIPPED.value
+                    for num in decimal_strings(tests_run - skipped + 1, tests_run + 1):
+                        test_status_map[prefix + num] = TestStatus.SKIPPED.value
             continue
 
         # Parse individual test methods (if available in verbose output)
-        method_match = re.match(method_pattern, cleaned_line)
+        method_match = (
+            _METHOD.match(cleaned_line) if "Time elapsed:" in cleaned_line else None
+        )
         if method_match:
             method_name = method_match.group(1)
             failure_indicator = method_match.group(2)
@@ -112,9 +125,8 @@ def parse_log_maven(log: str) -> dict[str, str]:
     # Alternative pattern for JUnit-style output
     if not test_status_map:
         # Look for JUnit XML-style patterns in console output
-        junit_pattern = r"^\s*(PASS|FAIL|SKIP).*?(\w+\.\w+).*$"
         for line in log.split("\n"):
-            match = re.match(junit_pattern, line.strip())
+            match = _JUNIT_STATUS.match(line.strip())
             if match:
                 status, test_name = match.groups()
                 if status == "PASS":
@@ -127,9 +139,8 @@ def parse_log_maven(log: str) -> dict[str, str]:
     # Gradle test output pattern
     if not test_status_map:
         # "com.example.TestClass > testMethod PASSED"
-        gradle_pattern = r"^(.+?)\s+>\s+(\w+)\s+(PASSED|FAILED|SKIPPED)$"
         for line in log.split("\n"):
-            match = re.match(gradle_pattern, line.strip())
+            match = _GRADLE_STATUS.match(line.strip())
             if match:
                 class_name, method_name, status = match.groups()
                 test_name = f"{class_name}.{method_name}"
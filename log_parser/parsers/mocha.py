@@ -12,6 +12,13 @@ class TestStatus(Enum):
     SKIPPED = "SKIPPED"
 
 
+_ANSI = re.compile(r"\x1b\[[0-9;]*m")
+_PASS = re.compile(r"^\s*[✓✔]\s+(.+?)(?:\s+\((\d+\s*m?s)\))?$")
+_FAIL = re.compile(r"^\s*\d+\)\s+(.+)$")
+_SKIP = re.compile(r"^\s*-\s+(.+)$")
+_TAP = re.compile(r"^(ok|not ok)\s+\d+\s+(.+)$")
+
+
 def parse_log_mocha(log: str) -> dict[str, str]:
     """
     Parser for test logs generated with Mocha.
@@ -33,24 +40,24 @@ def parse_log_mocha(log: str) -> dict[str, str]:
         line = line.strip()
 
         # Strip ANSI color codes
-        cleaned_line = re.sub(r"\x1b\[[0-9;]*m", "", line)
+        cleaned_line = _ANSI.sub("", line)
 
         # Passing tests (support both ✓ and ✔ checkmarks)
-        pass_match = re.match(r"^\s*[✓✔]\s+(.+?)(?:\s+\((\d+\s*m?s)\))?$", cleaned_line)
+        pass_match = _PASS.match(cleaned_line)
         if pass_match:
             test_name = pass_match.group(1).strip()
             test_status_map[test_name] = TestStatus.PASSED.value
             continue
 
         # Failing tests - pattern like "1) test name"
-        fail_match = re.match(r"^\s*\d+\)\s+(.+)$", cleaned_line)
+        fail_match = _FAIL.match(cleaned_line)
         if fail_match:
             test_name = fail_match.group(1).strip()
             test_status_map[test_name] = TestStatus.FAILED.value
             continue
 
         # Skipped tests
-        skip_match = re.match(r"^\s*-\s+(.+)$", cleaned_line)
+        skip_match = _SKIP.match(cleaned_line)
         if skip_match:
             test_name = skip_match.group(1).strip()
             test_status_map[test_name] = TestStatus.SKIPPED.value
@@ -58,9 +65,8 @@ def parse_log_mocha(log: str) -> dict[str, str]:
 
     # Alternative pattern for TAP output from Mocha
     if not test_status_map:
-        tap_pattern = r"^(ok|not ok)\s+\d+\s+(.+)$"
         for line in log.split("\n"):
-            match = re.match(tap_pattern, line.strip())
+            match = _TAP.match(line.strip())
             if match:
                 status, test_name = match.groups()
                 if status == "ok":
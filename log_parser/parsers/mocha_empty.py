@@ -8,6 +8,10 @@ class TestStatus(Enum):
     SKIPPED = "SKIPPED"
 
 
+_PASSING = re.compile(r"(\d+)\s+passing")
+_FAILING = re.compile(r"(\d+)\s+failing")
+
+
 def parse_log_mocha_empty(log: str) -> dict[str, str]:
     """
     Parses Mocha logs, including cases where 0 tests pass.
@@ -15,14 +19,15 @@ def parse_log_mocha_empty(log: str) -> dict[str, str]:
     results = {}
 
     # Standard Mocha "passing" line: "  13 passing (175ms)"
-    passing_match = re.search(r"(\d+)\s+passing", log)
+    # The substring checks skip a full regex sweep when the keyword is absent.
+    passing_match = _PASSING.search(log) if "passing" in log else None
     if passing_match:
         count = int(passing_match.group(1))
         for i in range(count):
             results[f"passing_test_{i}"] = TestStatus.PASSED.value
 
     # Standard Mocha "failing" line: "  5 failing"
-    failing_match = re.search(r"(\d+)\s+failing", log)
+    failing_match = _FAILING.search(log) if "failing" in log else None
     if failing_match:
         count = int(failing_match.group(1))
         for i in range(count):
@@ -8,16 +8,22 @@ class TestStatus(Enum):
     SKIPPED = "SKIPPED"
 
 
+_ANSI_ESCAPE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+# Mocha 'dot' reporter or summarized output, e.g. "172 passing (2s)", "1 failing"
+_PASSING = re.compile(r"(\d+) passing")
+_FAILING = re.compile(r"(\d+) failing")
+
+
 def parse_log_modernizr_custom(log: str) -> dict[str, str]:
     results = {}
 
-    # Clean ANSI escape codes
-    ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-    log = ansi_escape.sub("", log)
+    # Clean ANSI escape codes. They can sit between a count and its keyword
+    # ("5\x1b[0m passing"), so they are stripped rather than searched through,
+    # but only when the log contains any.
+    if "\x1b" in log:
+        log = _ANSI_ESCAPE.sub("", log)
 
-    # Patterns for passing/failing tests in Mocha 'dot' reporter or summarized output
-    # Example: "172 passing (2s)"
-    passing_match = re.search(r"(\d+) passing", log)
+    passing_match = _PASSING.search(log)
     if passing_match:
         passing_count = int(passing_match.group(1))
         for i in range(passing_count):
@@ -25,7 +31,7 @@ def parse_log_modernizr_custom(log: str) -> dict[str, str]:
 
     # Look for failures
     # Example: "1 failing" or list of failures
-    failing_match = re.search(r"(\d+) failing", log)
+    failing_match = _FAILING.search(log)
     if failing_match:
         failing_count = int(failing_match.group(1))
         for i in range(failing_count):
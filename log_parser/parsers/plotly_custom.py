@@ -8,6 +8,9 @@ class TestStatus(Enum):
     SKIPPED = "SKIPPED"
 
 
+_VALIDATING = re.compile(r"validating ([\w-]+)")
+
+
 def parse_log_plotly_custom(log: str) -> dict[str, str]:
     results = {}
 
@@ -31,8 +34,7 @@ def parse_log_plotly_custom(log: str) -> dict[str, str]:
         results["test-plain-obj: output2"] = TestStatus.PASSED.value
 
     # Parse test-mock validations
-    validating_matches = re.findall(r"validating ([\w-]+)", log)
-    for mock_name in validating_matches:
-        results[f"mock_validation: {mock_name}"] = TestStatus.PASSED.value
+    for match in _VALIDATING.finditer(log):
+        results[f"mock_validation: {match.group(1)}"] = TestStatus.PASSED.value
 
     return results
@@ -12,6 +12,14 @@ class TestStatus(Enum):
     SKIPPED = "SKIPPED"
 
 
+# "test_file.py::TestClass::test_method FAILED"
+_VERBOSE = re.compile(
+    r"^(.+?)::([\w_]+(?:::[\w_]+)?)\s+(PASSED|FAILED|SKIPPED|ERROR)(?:\s+\[.*?\])?$"
+)
+# Short test summary lines: "FAILED test_file.py::test_x - AssertionError"
+_SUMMARY = re.compile(r"^(FAILED|PASSED|SKIPPED)\s+(.+?)(?:\s+-\s+.*)?$")
+
+
 def parse_log_pytest(log: str) -> dict[str, str]:
     """
     Parser for test logs generated with pytest.
@@ -29,13 +37,9 @@ def parse_log_pytest(log: str) -> dict[str, str]:
     # "test_file.py::TestClass::test_method FAILED"
     # "test_file.py::test_skip SKIPPED"
 
-    verbose_pattern = (
-        r"^(.+?)::([\w_]+(?:::[\w_]+)?)\s+(PASSED|FAILED|SKIPPED|ERROR)(?:\s+\[.*?\])?$"
-    )
-
     for line in log.split("\n"):
         line = line.strip()
-        match = re.match(verbose_pattern, line)
+        match = _VERBOSE.match(line)
         if match:
             file_part, test_part, status = match.groups()
 
@@ -56,9 +60,8 @@ def parse_log_pytest(log: str) -> dict[str, str]:
     # Alternative pattern for dot notation output
     if not test_status_map:
         # Look for short test summary info
-        summary_pattern = r"^(FAILED|PASSED|SKIPPED)\s+(.+?)(?:\s+-\s+.*)?$"
         for line in log.split("\n"):
-            match = re.match(summary_pattern, line.strip())
+            match = _SUMMARY.match(line.strip())
             if match:
                 status, test_name = match.groups()
                 if status == "PASSED":
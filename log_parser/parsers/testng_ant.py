@@ -8,12 +8,15 @@ class TestStatus(Enum):
     SKIPPED = "SKIPPED"
 
 
+_RESULT = re.compile(r"\[testng\]\s+(PASSED|FAILED|SKIPPED):\s+(.+)")
+
+
 def parse_log_testng_ant(log: str) -> dict[str, str]:
     results = {}
-    pattern = re.compile(r"\[testng\]\s+(PASSED|FAILED|SKIPPED):\s+(.+)")
     for line in log.splitlines():
-        match = pattern.search(line)
+        match = _RESULT.search(line)
         if match:
             status_str, test_name = match.groups()
-            results[test_name.strip()] = status_str.strip()
+            # Shared enum value instead of a fresh string per test
+            results[test_name.strip()] = TestStatus[status_str].value
     return results
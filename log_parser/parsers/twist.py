@@ -8,6 +8,15 @@ class TestStatus(Enum):
     SKIPPED = "SKIPPED"
 
 
+_ANSI = re.compile(r"\x1b\[[0-9;]*[mGJKHFH]")
+# "[^\S\n]" keeps every whitespace run on one line, so searching the whole log
+# matches exactly what searching each line separately did
+_TOTALS = re.compile(
+    r"Tests:[^\S\n]+(\d+)[^\S\n]+passed(?:,[^\S\n]+(\d+)[^\S\n]+failed)?"
+    r"(?:,[^\S\n]+(\d+)[^\S\n]+skipped)?(?:,[^\S\n]+(\d+)[^\S\n]+total)?"
+)
+
+
 def parse_log_twist(log: str) -> dict[str, str]:
     test_status_map = {}
 
@@ -16,18 +25,21 @@ def parse_log_twist(log: str) -> dict[str, str]:
     skipped_count = 0
 
     # Remove ANSI escape sequences and other problematic characters
-    clean_log = re.sub(r"\x1b\[[0-9;]*[mGJKHFH]", "", log)
+    clean_log = _ANSI.sub("", log) if "\x1b" in log else log
     # Also handle the manual [2J [3J [H seen in the output
-    clean_log = re.sub(r"\[2J \[3J \[H", "", clean_log)
-
-    summary_line_pattern = r"Tests:\s+(\d+)\s+passed(?:,\s+(\d+)\s+failed)?(?:,\s+(\d+)\s+skipped)?(?:,\s+(\d+)\s+total)?"
-
-    for line in clean_log.split("\n"):
-        match = re.search(summary_line_pattern, line)
-        if match:
-            passed_count = int(match.group(1)) if match.group(1) else 0
-            failed_count = int(match.group(2)) if match.group(2) else 0
-            skipped_count = int(match.group(3)) if match.group(3) else 0
+    clean_log = clean_log.replace("[2J [3J [H", "")
+
+    # The last summary line wins (watch mode reprints it), and within that
+    # line the first summary counts
+    last = None
+    for last in _TOTALS.finditer(clean_log):
+        pass
+    if last:
+        line_start = clean_log.rfind("\n", 0, last.start()) + 1
+        match = _TOTALS.search(clean_log, line_start)
+        passed_count = int(match.group(1)) if match.group(1) else 0
+        failed_count = int(match.group(2)) if match.group(2) else 0
+        skipped_count = int(match.group(3)) if match.group(3) else 0
 
     if passed_count > 0:
         for i in range(passed_count):
@@ -0,0 +1,32 @@
+"""
+Helpers shared by several parser modules.
+"""
+
+import re
+
+
+# Summary lines are printed last, so look at the trailing lines before the full log.
+TAIL_CHARS = 4096
+
+
+def search_tail_first(pattern: re.Pattern, log: str):
+    """Search the last complete lines of the log first, then fall back to the whole log."""
+    if len(log) > TAIL_CHARS:
+        tail = log[-TAIL_CHARS:]
+        match = pattern.search(tail, tail.find("\n") + 1)
+        if match:
+            return match
+    return pattern.search(log)
+
+
+# Precomputed decimal strings for synthesized per-test keys ("<class>.test_<n>").
+_NUMS = [str(i) for i in range(1, 65536)]
+
+
+def decimal_strings(start: int, stop: int) -> list[str]:
+    """Return the decimal strings for ``range(start, stop)``, using ``_NUMS`` when possible."""
+    if stop <= start:
+        return []
+    if 1 <= start and stop <= len(_NUMS) + 1:
+        return _NUMS[start - 1 : stop - 1]
+    return [str(n) for n in range(start, stop)]
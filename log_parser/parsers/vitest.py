@@ -8,18 +8,22 @@ class TestStatus(Enum):
     SKIPPED = "SKIPPED"
 
 
+_ANSI_ESCAPE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+_FILE_SUMMARY = re.compile(
+    r"([✓✗])\s+(.*?)\s+\((\d+)\s+tests?(?:\s+\|\s+(\d+)\s+skipped)?\)\s+\d+\s*ms"
+)
+_INDIVIDUAL_TEST = re.compile(r"^\s+([✓✗])\s+(.*?)(?:\s+\d+\s+ms)?$", re.MULTILINE)
+_SUMMARY = re.compile(r"Tests\s+(?:(\d+)\s+failed\s+\|)?\s*(?:(\d+)\s+passed\s+)?")
+
+
 def strip_ansi(text: str) -> str:
-    ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-    return ansi_escape.sub("", text)
+    return _ANSI_ESCAPE.sub("", text)
 
 
 def parse_log_vitest(log: str) -> dict[str, str]:
     results = {}
     log = strip_ansi(log)
-    file_summary_pattern = re.compile(
-        r"([✓✗])\s+(.*?)\s+\((\d+)\s+tests?(?:\s+\|\s+(\d+)\s+skipped)?\)\s+\d+\s*ms"
-    )
-    for match in file_summary_pattern.finditer(log):
+    for match in _FILE_SUMMARY.finditer(log):
         status_char, file_path, test_count, skipped_count = match.groups()
         test_count = int(test_count)
         skipped_count = int(skipped_count or 0)
@@ -30,10 +34,7 @@ def parse_log_vitest(log: str) -> dict[str, str]:
             results[f"{file_path.strip()}_test_{i}"] = status
         for i in range(skipped_count):
             results[f"{file_path.strip()}_skipped_{i}"] = TestStatus.SKIPPED.value
-    individual_test_pattern = re.compile(
-        r"^\s+([✓✗])\s+(.*?)(?:\s+\d+\s+ms)?$", re.MULTILINE
-    )
-    for match in individual_test_pattern.finditer(log):
+    for match in _INDIVIDUAL_TEST.finditer(log):
         status_char, test_name = match.groups()
         if "(" in test_name and "tests)" in test_name:
             continue
@@ -41,9 +42,7 @@ def parse_log_vitest(log: str) -> dict[str, str]:
             TestStatus.PASSED.value if status_char == "✓" else TestStatus.FAILED.value
         )
         results[f"individual_{test_name.strip()}_{len(results)}"] = status
-    summary_match = re.search(
-        r"Tests\s+(?:(\d+)\s+failed\s+\|)?\s*(?:(\d+)\s+passed\s+)?", log
-    )
+    summary_match = _SUMMARY.search(log)
     if summary_match:
         failed = int(summary_match.group(1) or 0)
         passed = int(summary_match.group(2) or 0)
@@ -1,7 +1,13 @@
 #!/usr/bin/env python3
 """Unit tests for C++ test parsers."""
 
+import os
 import sys
+import tempfile
+import traceback
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -9,7 +15,11 @@ parent_dir = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(parent_dir))
 
 from log_parser.parsers.ctest import parse_log_ctest
-from log_parser.parsers.gtest import parse_log_gtest
+from log_parser.parsers.gtest import (
+    parse_log_gtest,
+    parse_log_gtest_bytes,
+    parse_log_gtest_path,
+)
 from log_parser.parsers.catch2 import parse_log_catch2
 from log_parser.parsers.boost_test import parse_log_boost_test
 from log_parser.parsers.cppunit import parse_log_cppunit
@@ -258,37 +268,47 @@ Tests run: 15, Failures: 2, Errors: 1, Skipped: 0
 # Test Helper Function
 # ============================================================================
 
+_STATUS_SYMBOL = {"PASSED": "✓", "FAILED": "✗", "SKIPPED": "○"}
+
+
+def _count_statuses(result):
+    """Count statuses in one C-level pass over the result values."""
+    return Counter(result.values())
+
+
 def test_parser(name, parser_func, log_content, expected_total=None, 
-                expected_passed=None, expected_failed=None, expected_skipped=None):
-    """Test a parser and validate results."""
-    print(f"\n{'=' * 60}")
-    print(f"Testing {name} parser")
-    print(f"{'=' * 60}")
-    
-    result = parser_func(log_content)
-    
-    # Validate result exists
-    assert result is not None, f"{name} parser returned None"
-    assert len(result) > 0, f"{name} parser returned empty dict"
-    
-    # Count statuses
-    passed = sum(1 for s in result.values() if s == "PASSED")
-    failed = sum(1 for s in result.values() if s == "FAILED")
-    skipped = sum(1 for s in result.values() if s == "SKIPPED")
-    
-    print(f"  Total tests: {len(result)}")
-    print(f"  PASSED: {passed}")
-    print(f"  FAILED: {failed}")
-    print(f"  SKIPPED: {skipped}")
-    
-    # Show sample results
-    print("\n  Sample results:")
-    for i, (test_name, status) in enumerate(list(result.items())[:5]):
-        symbol = "✓" if status == "PASSED" else "✗" if status == "FAILED" else "○"
-        print(f"    {symbol} {test_name}: {status}")
-    
-    if len(result) > 5:
-        print(f"    ... and {len(result) - 5} more")
+                expected_passed=None, expected_failed=None, expected_skipped=None,
+                result=None):
+    """Test a parser and validate results (pass result to skip re-parsing)."""
+    # Collect the report and emit it with a single write, even if parsing fails
+    out = [f"\n{'=' * 60}", f"Testing {name} parser", "=" * 60]
+    try:
+        if result is None:
+            result = parser_func(log_content)
+
+        # Validate result exists
+        assert result is not None, f"{name} parser returned None"
+        assert len(result) > 0, f"{name} parser returned empty dict"
+
+        # Count statuses
+        counts = _count_statuses(result)
+        passed, failed, skipped = counts["PASSED"], counts["FAILED"], counts["SKIPPED"]
+
+        out.append(f"  Total tests: {len(result)}")
+        out.append(f"  PASSED: {passed}")
+        out.append(f"  FAILED: {failed}")
+        out.append(f"  SKIPPED: {skipped}")
+
+        # Show sample results
+        out.append("\n  Sample results:")
+        for i, (test_name, status) in enumerate(islice(result.items(), 5)):
+            symbol = _STATUS_SYMBOL.get(status, "○")
+            out.append(f"    {symbol} {test_name}: {status}")
+
+        if len(result) > 5:
+            out.append(f"    ... and {len(result) - 5} more")
+    finally:
+        sys.stdout.write("\n".join(out) + "\n")
     
     # Validate against expected counts if provided
     if expected_total is not None:
@@ -321,92 +341,84 @@ if __name__ == "__main__":
     all_passed = True
     results = {}
     
-    try:
-        # CTest Parser Tests
-        print("\n" + "=" * 60)
-        print("CTEST PARSER TESTS")
-        print("=" * 60)
-        results["ctest_simple"] = test_parser(
-            "CTest (simple)", parse_log_ctest, ctest_log_simple,
-            expected_total=3, expected_passed=3, expected_failed=0
-        )
-        results["ctest_verbose"] = test_parser(
-            "CTest (verbose)", parse_log_ctest, ctest_log_verbose,
-            expected_total=5, expected_passed=4, expected_failed=1
-        )
-        
-        # Catch2 Parser Tests
-        print("\n" + "=" * 60)
-        print("CATCH2 PARSER TESTS")
-        print("=" * 60)
-        results["catch2_xml"] = test_parser(
-            "Catch2 (XML)", parse_log_catch2, catch2_xml_log,
-            expected_total=5, expected_passed=3, expected_failed=2
-        )
-        results["catch2_text"] = test_parser(
-            "Catch2 (text)", parse_log_catch2, catch2_text_log,
-            expected_total=50, expected_passed=50, expected_failed=0
-        )
-        results["catch2_summary"] = test_parser(
-            "Catch2 (summary)", parse_log_catch2, catch2_summary_log,
-            expected_total=150, expected_passed=145, expected_failed=5
-        )
-        
-        # GTest Parser Tests
-        print("\n" + "=" * 60)
-        print("GTEST PARSER TESTS")
-        print("=" * 60)
-        results["gtest_detailed"] = test_parser(
-            "GTest (detailed)", parse_log_gtest, gtest_log,
-            expected_failed=2  # At least verify we found the 2 failures
-        )
-        results["gtest_summary"] = test_parser(
-            "GTest (summary)", parse_log_gtest, gtest_summary_log,
-            expected_failed=2  # At least verify we found the 2 failures
-        )
-        
-        # Boost.Test Parser Tests
-        print("\n" + "=" * 60)
-        print("BOOST.TEST PARSER TESTS")
-        print("=" * 60)
-        results["boost_success"] = test_parser(
-            "Boost.Test (success)", parse_log_boost_test, boost_test_success_log,
-            expected_failed=0
-        )
-        results["boost_failure"] = test_parser(
-            "Boost.Test (failures)", parse_log_boost_test, boost_test_failure_log,
-            expected_failed=2  # At least verify we found the 2 failures
-        )
-        results["boost_suites"] = test_parser(
-            "Boost.Test (suites)", parse_log_boost_test, boost_test_with_suites,
-            expected_failed=1  # At least verify we found the 1 failure
-        )
-        
-        # CppUnit Parser Tests
-        print("\n" + "=" * 60)
-        print("CPPUNIT PARSER TESTS")
-        print("=" * 60)
-        results["cppunit_success"] = test_parser(
-            "CppUnit (success)", parse_log_cppunit, cppunit_success_log,
-            expected_total=150, expected_passed=150, expected_failed=0
-        )
-        results["cppunit_failure"] = test_parser(
-            "CppUnit (failures)", parse_log_cppunit, cppunit_failure_log,
-            expected_failed=2  # 2 explicit failures captured
-        )
-        results["cppunit_detailed"] = test_parser(
-            "CppUnit (detailed)", parse_log_cppunit, cppunit_detailed_log,
-            expected_failed=3  # At least verify we found the 3 failures/errors
-        )
-        
-    except AssertionError as e:
-        print(f"\n\n❌ TEST FAILED: {e}")
-        all_passed = False
-    except Exception as e:
-        print(f"\n\n❌ UNEXPECTED ERROR: {e}")
-        import traceback
-        traceback.print_exc()
-        all_passed = False
+    # (section, result key, display name, parser, log, expected counts)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        gtest_log_path = Path(tmp_dir) / "test_output.txt"
+        gtest_log_path.write_text(gtest_log)
+        gtest_detailed_total = len(parse_log_gtest(gtest_log))
+        gtest_summary_total = len(parse_log_gtest(gtest_summary_log))
+
+        cases = [
+            # CTest Parser Tests
+            ("CTEST", "ctest_simple", "CTest (simple)", parse_log_ctest, ctest_log_simple,
+             dict(expected_total=3, expected_passed=3, expected_failed=0)),
+            ("CTEST", "ctest_verbose", "CTest (verbose)", parse_log_ctest, ctest_log_verbose,
+             dict(expected_total=5, expected_passed=4, expected_failed=1)),
+            # Catch2 Parser Tests
+            ("CATCH2", "catch2_xml", "Catch2 (XML)", parse_log_catch2, catch2_xml_log,
+             dict(expected_total=5, expected_passed=3, expected_failed=2)),
+            ("CATCH2", "catch2_text", "Catch2 (text)", parse_log_catch2, catch2_text_log,
+             dict(expected_total=50, expected_passed=50, expected_failed=0)),
+            ("CATCH2", "catch2_summary", "Catch2 (summary)", parse_log_catch2, catch2_summary_log,
+             dict(expected_total=150, expected_passed=145, expected_failed=5)),
+            # GTest Parser Tests
+            ("GTEST", "gtest_detailed", "GTest (detailed)", parse_log_gtest, gtest_log,
+             dict(expected_failed=2)),  # At least verify we found the 2 failures
+            ("GTEST", "gtest_summary", "GTest (summary)", parse_log_gtest, gtest_summary_log,
+             dict(expected_failed=2)),  # At least verify we found the 2 failures
+            ("GTEST", "gtest_detailed_bytes", "GTest (detailed, bytes)",
+             parse_log_gtest_bytes, gtest_log.encode(),
+             dict(expected_total=gtest_detailed_total, expected_failed=2)),
+            ("GTEST", "gtest_summary_bytes", "GTest (summary, bytes)",
+             parse_log_gtest_bytes, gtest_summary_log.encode(),
+             dict(expected_total=gtest_summary_total, expected_failed=2)),
+            ("GTEST", "gtest_detailed_path", "GTest (detailed, mmap)",
+             parse_log_gtest_path, gtest_log_path,
+             dict(expected_total=gtest_detailed_total, expected_failed=2)),
+            # Boost.Test Parser Tests
+            ("BOOST.TEST", "boost_success", "Boost.Test (success)",
+             parse_log_boost_test, boost_test_success_log,
+             dict(expected_failed=0)),
+            ("BOOST.TEST", "boost_failure", "Boost.Test (failures)",
+             parse_log_boost_test, boost_test_failure_log,
+             dict(expected_failed=2)),  # At least verify we found the 2 failures
+            ("BOOST.TEST", "boost_suites", "Boost.Test (suites)",
+             parse_log_boost_test, boost_test_with_suites,
+             dict(expected_failed=1)),  # At least verify we found the 1 failure
+            # CppUnit Parser Tests
+            ("CPPUNIT", "cppunit_success", "CppUnit (success)", parse_log_cppunit, cppunit_success_log,
+             dict(expected_total=150, expected_passed=150, expected_failed=0)),
+            ("CPPUNIT", "cppunit_failure", "CppUnit (failures)", parse_log_cppunit, cppunit_failure_log,
+             dict(expected_failed=2)),  # 2 explicit failures captured
+            ("CPPUNIT", "cppunit_detailed", "CppUnit (detailed)", parse_log_cppunit, cppunit_detailed_log,
+             dict(expected_failed=3)),  # At least verify we found the 3 failures/errors
+        ]
+
+        # Parse every case in a worker process, then validate and report in
+        # case order; a failing case is reported and the rest still run
+        with ProcessPoolExecutor(max_workers=min(len(cases), os.cpu_count() or 1)) as ex:
+            futures = [ex.submit(case[3], case[4]) for case in cases]
+
+            section = None
+            for (case_section, key, name, parser_func, log_content, expected), future in zip(cases, futures):
+                if case_section != section:
+                    section = case_section
+                    print("\n" + "=" * 60)
+                    print(f"{section} PARSER TESTS")
+                    print("=" * 60)
+                try:
+                    results[key] = test_parser(
+                        name, parser_func, log_content, **expected, result=future.result()
+                    )
+                except AssertionError as e:
+                    print(f"\n\n❌ TEST FAILED: {e}")
+                    results[key] = None
+                    all_passed = False
+                except Exception as e:
+                    print(f"\n\n❌ UNEXPECTED ERROR: {e}")
+                    traceback.print_exc()
+                    results[key] = None
+                    all_passed = False
     
     # Final Summary
     print("\n" + "=" * 60)
@@ -416,8 +428,8 @@ if __name__ == "__main__":
     for test_name, result in results.items():
         if result:
             total = len(result)
-            passed = sum(1 for s in result.values() if s == "PASSED")
-            failed = sum(1 for s in result.values() if s == "FAILED")
+            counts = _count_statuses(result)
+            passed, failed = counts["PASSED"], counts["FAILED"]
             print(f"✓ {test_name:25s}: {total:3d} tests ({passed} passed, {failed} failed)")
         else:
             print(f"✗ {test_name:25s}: Failed to parse")
@@ -429,4 +441,4 @@ if __name__ == "__main__":
         print("❌ SOME TESTS FAILED!")
     print("=" * 60)
     
-    exit(0 if all_passed else 1)
+    sys.exit(0 if all_passed else 1)
@@ -7,6 +7,7 @@ from log_parser.parsers.mocha import parse_log_mocha
 from log_parser.parsers.go_test import parse_log_go_test
 from log_parser.parsers.cargo import parse_log_cargo
 from log_parser.parsers.maven import parse_log_maven
+from log_parser.parsers.junit import parse_log_junit
 
 # Pytest with -vv (extra verbose)
 pytest_vv_log = """
@@ -170,6 +171,17 @@ testCacheInvalidation(com.example.IntegrationTest)  Time elapsed: 0.156 sec  <<<
 Tests run: 3, Failures: 1, Errors: 0, Skipped: 0, Time elapsed: 0.933 sec <<< FAILURE!
 """
 
+# Summaries whose skipped or failed counts exceed the tests run
+surefire_more_skipped_log = """
+Running com.example.FooTest
+Tests run: 0, Failures: 0, Errors: 0, Skipped: 2
+"""
+
+surefire_more_failed_log = """
+Running com.example.FooTest
+Tests run: 1, Failures: 3, Errors: 0, Skipped: 0
+"""
+
 
 def test_edge_cases():
     """Test edge cases and additional verbose formats."""
@@ -243,6 +255,15 @@ def test_edge_cases():
     else:
         print("   ✗ Failed to parse")
 
+    # Test maven/junit summaries with inconsistent counts
+    print("\n7. Testing maven/junit summaries with more skipped/failed than run")
+    for parser in (parse_log_maven, parse_log_junit):
+        result = parser(surefire_more_skipped_log)
+        assert list(result.values()) == ["SKIPPED", "SKIPPED"], len(result)
+        result = parser(surefire_more_failed_log)
+        assert list(result.values()) == ["FAILED", "FAILED", "FAILED"], len(result)
+        print(f"   ✓ {parser.__name__} synthesized only the reported tests")
+
 
 if __name__ == "__main__":
     test_edge_cases()
@@ -0,0 +1,44 @@
+"""
+Shared helpers for the pipeline scripts (simple_repo_to_dockerfile.py,
+verify_dockerfile.py, verify_testing.py): the files they exchange through a
+result directory and their buffered console reports.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+try:
+    # Optional faster JSON reader/writer (pip install orjson)
+    import orjson
+except ImportError:
+    orjson = None
+
+# Parse-result caches written by verify_testing.py next to test_output.txt,
+# which is inside the Docker build context
+PARSE_CACHE_PREFIX = ".cache_"
+
+
+def load_json(path: Path):
+    """Read a JSON file, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def dump_json(data, path: Path) -> None:
+    """Write data as JSON indented by two spaces, with orjson when it is installed."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+
+
+def write_report(lines: list) -> None:
+    """Write buffered report lines to stdout with a single write, then clear them."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+        lines.clear()
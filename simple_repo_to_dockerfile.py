@@ -8,13 +8,18 @@ The agent creates the Dockerfile using git clone approach with extended timeouts
 
 import sys
 import os
+import copy
+import functools
 import shutil
 import yaml
 import platform
 import subprocess
 import argparse
 import json
+import mmap
 import re
+import shlex
+import signal
 import threading
 from pathlib import Path
 from dataclasses import asdict, dataclass, field
@@ -24,6 +29,44 @@ from minisweagent.agents.default import DefaultAgent
 from minisweagent.agents.interactive import InteractiveAgent, InteractiveAgentConfig
 from minisweagent.models.litellm_model import LitellmModel
 from minisweagent.run.utils.save import save_traj
+from pipeline_io import dump_json, load_json, write_report
+
+try:
+    # libyaml-backed loader when PyYAML was built with it
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+# RUN commands that likely run tests, as one alternation scanned in a single
+# pass. Groups are numbered in priority order: the lowest-numbered command
+# found anywhere in the Dockerfile wins, then the leftmost one of that kind.
+# Bytes patterns: the Dockerfile is scanned through a read-only mmap and only
+# the matched command is decoded. Lines may end in "\r" here, which text-mode
+# reads used to translate to "\n", so the generic pattern stops at either.
+_TEST_COMMAND = re.compile(
+    rb"RUN\s+(?:"
+    rb"(?P<npm>npm\s+test)"
+    rb"|(?P<yarn>yarn\s+test)"
+    rb"|(?P<pytest>pytest)"
+    rb"|(?P<python_pytest>python\s+-m\s+pytest)"
+    rb"|(?P<cargo>cargo\s+test)"
+    rb"|(?P<go>go\s+test)"
+    rb"|(?P<mvn>mvn\s+test)"
+    rb"|(?P<gradle>gradle\s+test)"
+    rb")",
+    re.IGNORECASE,
+)
+_GENERIC_TEST_COMMAND = re.compile(rb"RUN\s+([^\r\n]+test[^\r\n]+)", re.IGNORECASE)
+
+
+# Anything a shell would interpret beyond quoting and word splitting
+_SHELL_META = re.compile(r"[|&;<>$`(){}*?\[\]~#\\\n]")
+# Builtins keep running under sh: their standalone binaries (if any) differ
+_SHELL_BUILTINS = frozenset(
+    "cd echo printf test [ pwd type command kill read export unset set alias "
+    "source . eval exec exit ulimit umask wait trap shift return local hash".split()
+)
 
 
 @dataclass
@@ -43,16 +86,42 @@ class ExtendedLocalEnvironment:
     ):
         """This class executes bash commands directly on the local machine with extended timeouts."""
         self.config = config_class(**kwargs)
+        self._env = os.environ | self.config.env
+
+    def _direct_argv(self, command: str) -> Optional[list[str]]:
+        """Return argv for commands that need no shell, or None to run via sh -c."""
+        if _SHELL_META.search(command):
+            return None
+        try:
+            argv = shlex.split(command)
+        except ValueError:
+            return None
+        if not argv or "=" in argv[0] or argv[0] in _SHELL_BUILTINS:
+            return None
+        # Unknown programs go through sh so the "not found" output stays the same
+        if shutil.which(argv[0], path=self._env.get("PATH")) is None:
+            return None
+        return argv
 
     def execute(self, command: str, cwd: str = ""):
         """Execute a command in the local environment and return the result as a dict."""
         cwd = cwd or self.config.cwd or os.getcwd()
+        # Simple commands are exec'd directly, saving the intermediate shell process
+        argv = self._direct_argv(command)
+        if argv is not None:
+            try:
+                return self._run(argv, cwd, shell=False)
+            except OSError:
+                pass  # e.g. a script without a shebang line, which sh can still run
+        return self._run(command, cwd, shell=True)
+
+    def _run(self, args, cwd: str, shell: bool) -> dict:
         result = subprocess.run(
-            command,
-            shell=True,
+            args,
+            shell=shell,
             text=True,
             cwd=cwd,
-            env=os.environ | self.config.env,
+            env=self._env,
             timeout=self.config.timeout,
             encoding="utf-8",
             errors="replace",
@@ -65,6 +134,189 @@ class ExtendedLocalEnvironment:
         return asdict(self.config) | platform.uname()._asdict() | os.environ
 
 
+@functools.lru_cache(maxsize=8)
+def _load_config(path_str: str, mtime: float) -> dict:
+    """Parse a YAML config once per (path, mtime); callers get a deep copy."""
+    with open(path_str, "rb") as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def load_config(config_path: Path) -> dict:
+    """Load a YAML config file, reusing the parse while the file is unchanged."""
+    return copy.deepcopy(_load_config(str(config_path), config_path.stat().st_mtime))
+
+
+# Directory holding this script and the helper scripts the agent is pointed at
+_SCRIPT_DIR = str(Path(__file__).parent.resolve())
+
+# Prompt sections prepended to the agent's instance template
+_HELPER_SCRIPTS_SECTION = f"""
+## Helper Scripts Available
+
+The following helper scripts are available in this directory:
+- Verification script: `{_SCRIPT_DIR}/verify_dockerfile.py`
+- Testing verification: `{_SCRIPT_DIR}/verify_testing.py`
+
+Use the full paths shown above when calling these scripts.
+
+"""
+
+# Bare "python verify_*.py" invocations in templates, rewritten to absolute paths
+_VERIFY_SCRIPT_RE = re.compile(r"\bpython\s+(verify_(?:dockerfile|testing))\.py\b")
+
+# Filled in with str.format (script_dir, failure_threshold, threshold_percent)
+_VERIFY_TESTING_SECTION = """
+## IMPORTANT: Test Output Parsing Required
+
+**IF THE REPOSITORY HAS TESTS:**
+
+After running `verify_dockerfile.py` successfully, you MUST also run `verify_testing.py` to parse the test output:
+
+```bash
+python {script_dir}/verify_testing.py agent-result/$repo_folder_name/Dockerfile --failure-threshold {failure_threshold}
+```
+
+**Note:** Tests are considered passing if the failure rate is below {threshold_percent}% (up to {threshold_percent}% of tests can fail).
+
+The `verify_testing.py` script will:
+1. Read `test_output.txt` generated by `verify_dockerfile.py`
+2. Read `repo_metadata.json` to determine the test framework
+3. Parse the test output and generate `parsed_test_status.json`
+
+**Your task is not complete until `verify_testing.py` runs successfully and generates `parsed_test_status.json`.**
+
+After parsing succeeds, verify completeness by checking `agent-result/$repo_folder_name/test_output.txt` for test counts (e.g., "123 tests", "45 passing") and comparing with parsed count. If significantly different, the parser may be incomplete - update it.
+
+**If `verify_testing.py` fails:**
+
+Check `agent-result/$repo_folder_name/test_output.txt` to see if tests actually ran:
+- **Tests showed "UP-TO-DATE" or "SKIPPED" (cached results)**: Update `test_commands` in `repo_metadata.json` to force fresh execution
+  - For Gradle: Add `--rerun-tasks` flag (e.g., change `./gradlew test` to `./gradlew test --rerun-tasks ...`)
+  - For C++ projects with CMake/CTest: Add `--rerun-failed --repeat until-pass:1` flags (e.g., `cd build && ctest --verbose --rerun-failed`)
+  - For other build tools: Use appropriate cache-bypassing flags
+  - Then re-run verification with the updated test_commands
+- **Tests ran successfully but parsing failed**: Create/update a parser (see options below)
+
+**For C++ projects:**
+- Build systems: CMake (most common), Bazel, Make, Autotools
+- Test frameworks: CTest (CMake), Google Test, Catch2, Boost.Test, CppUnit
+- Ensure test commands produce verbose output (e.g., `ctest --verbose`)
+- For gtest: Use `--gtest_color=no` to disable color codes that break parsing
+- For catch2: XML output is preferred: `./test_binary --reporter xml`
+- **No tests exist**: Mark as no-tests repo (see below)
+
+**Creating/Updating Parsers (if tests ran but couldn't be parsed):**
+
+Choose the appropriate approach:
+1. **Add framework parser** (e.g., `cspell.py`): For known frameworks we don't support
+2. **Enhance existing parser**: Add patterns to existing parser (only if safe)
+3. **Custom parser** (e.g., `graphql_spec_custom.py`): For unique test formats
+
+Requirements:
+- Location: `{script_dir}/log_parser/parsers/`
+- Signature: `parse_log_<name>(log: str) -> dict[str, str]`
+- Register in `verify_testing.py`: Add to PARSERS dict and import
+- **Never break existing parsers** - if unsure, make a custom one
+
+Example:
+```python
+from enum import Enum
+
+class TestStatus(Enum):
+    PASSED = "PASSED"
+    FAILED = "FAILED"
+    SKIPPED = "SKIPPED"
+
+def parse_log_<name>(log: str) -> dict[str, str]:
+    # Parse logic based on test_output.txt format
+    return {{"test_name": TestStatus.PASSED.value}}
+```
+
+**Repos with NO tests (rare):**
+
+Only mark as no-tests if ALL true:
+- No test scripts in package.json/setup.py/etc.
+- No test files or directories
+- Running test command shows "no tests found"
+
+Then: Set `test_commands: []` and `test_framework: "none"`, skip `verify_testing.py`
+
+**IMPORTANT:** Do not use workarounds like `|| (echo ...)` to create fake result files when parsing fails. Your task requires successful parsing. Iterate to fix the root cause (test command or parser).
+
+"""
+
+
+# Extra time given to an agent that is still running when its time limit expires
+_CLEANUP_GRACE_SECONDS = 60
+
+
+class AgentTimeout(BaseException):
+    """Raised inside the agent when it exceeds its time limit (not an Exception, so agents cannot swallow it)."""
+
+
+def run_agent_with_deadline(agent, task: str, max_time: int) -> tuple[dict, bool]:
+    """
+    Run agent.run(task) with a wall-clock limit plus a short cleanup grace period.
+
+    On POSIX the main thread is interrupted with SIGALRM, so a timed-out agent
+    actually stops instead of running on (and spending) in a leaked thread.
+    Elsewhere the agent runs in a daemon thread that is abandoned on timeout.
+
+    Returns:
+        (result_container, timeout_occurred): the container holds "exit_status"
+        and "result", or "error" if the agent raised.
+    """
+    result_container = {}
+
+    def run_agent():
+        try:
+            result_container["exit_status"], result_container["result"] = agent.run(
+                task=task
+            )
+        except AgentTimeout:
+            raise
+        except BaseException as e:
+            # Catch all exceptions including SystemExit (raised on cost/step limit)
+            result_container["error"] = e
+
+    if hasattr(signal, "SIGALRM") and threading.current_thread() is threading.main_thread():
+        limit_reached = False
+
+        def on_alarm(signum, frame):
+            nonlocal limit_reached
+            if not limit_reached:
+                # Could be a hang or just finishing up - allow a little more time
+                limit_reached = True
+                print("⏰ Agent execution time limit reached, waiting for cleanup...")
+                signal.setitimer(signal.ITIMER_REAL, _CLEANUP_GRACE_SECONDS)
+                return
+            raise AgentTimeout()
+
+        previous_handler = signal.signal(signal.SIGALRM, on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, max_time)
+        try:
+            run_agent()
+        except AgentTimeout:
+            return result_container, True
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous_handler)
+    else:
+        agent_thread = threading.Thread(target=run_agent, daemon=True)
+        agent_thread.start()
+        agent_thread.join(timeout=max_time)
+        limit_reached = agent_thread.is_alive()
+        if limit_reached:
+            print("⏰ Agent execution time limit reached, waiting for cleanup...")
+            agent_thread.join(timeout=_CLEANUP_GRACE_SECONDS)
+            if agent_thread.is_alive():
+                return result_container, True
+
+    if limit_reached:
+        print("✅ Agent completed during cleanup period")
+    return result_container, False
+
+
 def extract_test_command_from_dockerfile(dockerfile_path: Path) -> Optional[Dict]:
     """
     Extract test command information from a Dockerfile by parsing RUN commands.
@@ -73,57 +325,56 @@ def extract_test_command_from_dockerfile(dockerfile_path: Path) -> Optional[Dict
     if not dockerfile_path.exists():
         return None
 
-    dockerfile_content = dockerfile_path.read_text()
-
-    # Look for RUN commands that likely run tests
-    test_patterns = [
-        r"RUN\s+(npm\s+test)",
-        r"RUN\s+(yarn\s+test)",
-        r"RUN\s+(pytest)",
-        r"RUN\s+(python\s+-m\s+pytest)",
-        r"RUN\s+(cargo\s+test)",
-        r"RUN\s+(go\s+test)",
-        r"RUN\s+(mvn\s+test)",
-        r"RUN\s+(gradle\s+test)",
-        r"RUN\s+(.+test.+)",  # Generic fallback
-    ]
-
-    for pattern in test_patterns:
-        match = re.search(pattern, dockerfile_content, re.IGNORECASE)
-        if match:
-            test_command = match.group(1)
-
-            # Try to determine framework from command - standardized names
-            framework = "unknown"
-            language = "unknown"
-
-            if "npm" in test_command or "yarn" in test_command:
-                # Try to detect specific JS framework
-                framework = "mocha"  # Default, could be jest
-                language = "javascript"
-            elif "pytest" in test_command:
-                framework = "pytest"
-                language = "python"
-            elif "cargo test" in test_command:
-                framework = "cargo"
-                language = "rust"
-            elif "go test" in test_command:
-                framework = "go_test"
-                language = "go"
-            elif "mvn" in test_command:
-                framework = "maven"
-                language = "java"
-            elif "gradle" in test_command:
-                framework = "maven"  # Use maven parser for gradle too
-                language = "java"
-
-            return {
-                "test_command": test_command,
-                "test_framework": framework,
-                "language": language,
-            }
-
-    return None
+    with open(dockerfile_path, "rb") as f:
+        # mmap cannot map an empty file
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as dockerfile_content:
+            # Look for RUN commands that likely run tests
+            match = None
+            for candidate in _TEST_COMMAND.finditer(dockerfile_content):
+                if match is None or candidate.lastindex < match.lastindex:
+                    match = candidate
+                    if match.lastindex == 1:
+                        break
+            if match is None:
+                match = _GENERIC_TEST_COMMAND.search(dockerfile_content)
+
+            if match is None:
+                return None
+
+            test_command = match.group(match.lastindex).decode("utf-8", errors="replace")
+            test_command = test_command.replace("\r\n", "\n").replace("\r", "\n")
+
+    # Try to determine framework from command - standardized names
+    framework = "unknown"
+    language = "unknown"
+
+    if "npm" in test_command or "yarn" in test_command:
+        # Try to detect specific JS framework
+        framework = "mocha"  # Default, could be jest
+        language = "javascript"
+    elif "pytest" in test_command:
+        framework = "pytest"
+        language = "python"
+    elif "cargo test" in test_command:
+        framework = "cargo"
+        language = "rust"
+    elif "go test" in test_command:
+        framework = "go_test"
+        language = "go"
+    elif "mvn" in test_command:
+        framework = "maven"
+        language = "java"
+    elif "gradle" in test_command:
+        framework = "maven"  # Use maven parser for gradle too
+        language = "java"
+
+    return {
+        "test_command": test_command,
+        "test_framework": framework,
+        "language": language,
+    }
 
 
 def main():
@@ -236,7 +487,14 @@ def main():
     repo_result_dir = base_result_dir / repo_folder_name
 
     if repo_result_dir.exists():
-        shutil.rmtree(repo_result_dir)
+        # Move the previous run aside (one rename) and delete it in the
+        # background. The thread is not a daemon, so interpreter exit waits
+        # for it instead of leaving a half-deleted directory behind.
+        stale_dir = base_result_dir / f".{repo_folder_name}.old.{os.getpid()}"
+        repo_result_dir.rename(stale_dir)
+        threading.Thread(
+            target=shutil.rmtree, args=(stale_dir,), kwargs={"ignore_errors": True}
+        ).start()
     repo_result_dir.mkdir()
 
     print(f"📁 Results will be saved to: {repo_result_dir}")
@@ -253,117 +511,32 @@ def main():
         print(f"❌ Configuration file {config_filename} not found!")
         sys.exit(1)
 
-    config_data = yaml.safe_load(config_path.read_text())["agent"]
+    config_data = load_config(config_path)["agent"]
 
     # Override cost_limit with CLI argument
     config_data["cost_limit"] = args.max_cost
 
     # Inject script directory into templates for agent to use
-    script_dir = str(Path(__file__).parent.resolve())
     if "instance_template" in config_data:
         # Add script directory information to the beginning of the prompt
-        helper_scripts_section = f"""
-## Helper Scripts Available
-
-The following helper scripts are available in this directory:
-- Verification script: `{script_dir}/verify_dockerfile.py`
-- Testing verification: `{script_dir}/verify_testing.py`
-
-Use the full paths shown above when calling these scripts.
-
-"""
+        helper_scripts_section = _HELPER_SCRIPTS_SECTION
 
         # Add verify-testing specific instructions if flag is set
         if args.verify_testing:
-            threshold_percent = int(args.failure_threshold * 100)
-            helper_scripts_section += f"""
-## IMPORTANT: Test Output Parsing Required
-
-**IF THE REPOSITORY HAS TESTS:**
-
-After running `verify_dockerfile.py` successfully, you MUST also run `verify_testing.py` to parse the test output:
-
-```bash
-python {script_dir}/verify_testing.py agent-result/$repo_folder_name/Dockerfile --failure-threshold {args.failure_threshold}
-```
-
-**Note:** Tests are considered passing if the failure rate is below {threshold_percent}% (up to {threshold_percent}% of tests can fail).
-
-The `verify_testing.py` script will:
-1. Read `test_output.txt` generated by `verify_dockerfile.py`
-2. Read `repo_metadata.json` to determine the test framework
-3. Parse the test output and generate `parsed_test_status.json`
-
-**Your task is not complete until `verify_testing.py` runs successfully and generates `parsed_test_status.json`.**
-
-After parsing succeeds, verify completeness by checking `agent-result/$repo_folder_name/test_output.txt` for test counts (e.g., "123 tests", "45 passing") and comparing with parsed count. If significantly different, the parser may be incomplete - update it.
-
-**If `verify_testing.py` fails:**
-
-Check `agent-result/$repo_folder_name/test_output.txt` to see if tests actually ran:
-- **Tests showed "UP-TO-DATE" or "SKIPPED" (cached results)**: Update `test_commands` in `repo_metadata.json` to force fresh execution
-  - For Gradle: Add `--rerun-tasks` flag (e.g., change `./gradlew test` to `./gradlew test --rerun-tasks ...`)
-  - For C++ projects with CMake/CTest: Add `--rerun-failed --repeat until-pass:1` flags (e.g., `cd build && ctest --verbose --rerun-failed`)
-  - For other build tools: Use appropriate cache-bypassing flags
-  - Then re-run verification with the updated test_commands
-- **Tests ran successfully but parsing failed**: Create/update a parser (see options below)
-
-**For C++ projects:**
-- Build systems: CMake (most common), Bazel, Make, Autotools
-- Test frameworks: CTest (CMake), Google Test, Catch2, Boost.Test, CppUnit
-- Ensure test commands produce verbose output (e.g., `ctest --verbose`)
-- For gtest: Use `--gtest_color=no` to disable color codes that break parsing
-- For catch2: XML output is preferred: `./test_binary --reporter xml`
-- **No tests exist**: Mark as no-tests repo (see below)
-
-**Creating/Updating Parsers (if tests ran but couldn't be parsed):**
-
-Choose the appropriate approach:
-1. **Add framework parser** (e.g., `cspell.py`): For known frameworks we don't support
-2. **Enhance existing parser**: Add patterns to existing parser (only if safe)
-3. **Custom parser** (e.g., `graphql_spec_custom.py`): For unique test formats
-
-Requirements:
-- Location: `{script_dir}/log_parser/parsers/`
-- Signature: `parse_log_<name>(log: str) -> dict[str, str]`
-- Register in `verify_testing.py`: Add to PARSERS dict and import
-- **Never break existing parsers** - if unsure, make a custom one
-
-Example:
-```python
-from enum import Enum
-
-class TestStatus(Enum):
-    PASSED = "PASSED"
-    FAILED = "FAILED"
-    SKIPPED = "SKIPPED"
-
-def parse_log_<name>(log: str) -> dict[str, str]:
-    # Parse logic based on test_output.txt format
-    return {{"test_name": TestStatus.PASSED.value}}
-```
-
-**Repos with NO tests (rare):**
-
-Only mark as no-tests if ALL true:
-- No test scripts in package.json/setup.py/etc.
-- No test files or directories
-- Running test command shows "no tests found"
-
-Then: Set `test_commands: []` and `test_framework: "none"`, skip `verify_testing.py`
-
-**IMPORTANT:** Do not use workarounds like `|| (echo ...)` to create fake result files when parsing fails. Your task requires successful parsing. Iterate to fix the root cause (test command or parser).
-
-"""
+            helper_scripts_section += _VERIFY_TESTING_SECTION.format(
+                script_dir=_SCRIPT_DIR,
+                failure_threshold=args.failure_threshold,
+                threshold_percent=int(args.failure_threshold * 100),
+            )
 
         config_data["instance_template"] = (
             helper_scripts_section + config_data["instance_template"]
         )
 
-        # Also replace any hardcoded references
-        config_data["instance_template"] = config_data["instance_template"].replace(
-            "python verify_dockerfile.py",
-            f"python {script_dir}/verify_dockerfile.py --failure-threshold {args.failure_threshold}",
+        # Also replace any hardcoded references (both scripts take --failure-threshold)
+        config_data["instance_template"] = _VERIFY_SCRIPT_RE.sub(
+            lambda m: f"python {_SCRIPT_DIR}/{m.group(1)}.py --failure-threshold {args.failure_threshold}",
+            config_data["instance_template"],
         )
 
     # Create agent based on livestream preference
@@ -381,65 +554,21 @@ Then: Set `test_commands: []` and `test_framework: "none"`, skip `verify_testing
     else:
         agent = DefaultAgent(model, environment, **config_data)
 
+    report = []
     try:
         # Run the agent - it will handle everything including output creation
         print(f"🤖 Starting agent to analyze {repo_name}...")
         print(f"💰 Cost limit: ${args.max_cost:.2f}")
         print(f"⏱️  Time limit: {args.max_time} seconds ({args.max_time // 60} minutes)")
 
-        # Set up timeout using threading
-        timeout_occurred = False
-        result_container = {}
-
-        def run_agent_with_timeout():
-            try:
-                result_container["exit_status"], result_container["result"] = agent.run(
-                    task=repo_name
-                )
-            except BaseException as e:
-                # Catch all exceptions including SystemExit (raised on cost/step limit)
-                result_container["error"] = e
-
-        agent_thread = threading.Thread(target=run_agent_with_timeout)
-        agent_thread.daemon = True
-        agent_thread.start()
-        agent_thread.join(timeout=args.max_time)
-
-        if agent_thread.is_alive():
-            # Thread is still running after max_time - could be timeout or hanging
-            # Wait a bit more to see if it's just finishing up
-            print("⏰ Agent execution time limit reached, waiting for cleanup...")
-            agent_thread.join(timeout=60)  # Give 60 more seconds for graceful cleanup
+        result_container, timeout_occurred = run_agent_with_deadline(
+            agent, repo_name, args.max_time
+        )
 
-            if agent_thread.is_alive():
-                # Still alive after grace period - treat as timeout
-                timeout_occurred = True
-                print(
-                    f"⏰ Agent execution exceeded time limit of {args.max_time} seconds!"
-                )
-                exit_status = "TIMEOUT"
-                result = f"Agent execution timed out after {args.max_time} seconds"
-            else:
-                # Thread finished during grace period
-                print("✅ Agent completed during cleanup period")
-                if "error" in result_container:
-                    error = result_container["error"]
-                    if isinstance(error, SystemExit):
-                        # Completed but hit limit at the end
-                        if (
-                            "exit_status" in result_container
-                            and "result" in result_container
-                        ):
-                            exit_status = result_container["exit_status"]
-                            result = result_container["result"]
-                        else:
-                            exit_status = "LIMIT_EXCEEDED"
-                            result = f"Agent hit cost/step limit: {error}"
-                    else:
-                        raise error
-                else:
-                    exit_status = result_container.get("exit_status", "ERROR")
-                    result = result_container.get("result", "Unknown error")
+        if timeout_occurred:
+            print(f"⏰ Agent execution exceeded time limit of {args.max_time} seconds!")
+            exit_status = "TIMEOUT"
+            result = f"Agent execution timed out after {args.max_time} seconds"
         elif "error" in result_container:
             error = result_container["error"]
             # Check if it's a SystemExit from cost/step limit
@@ -478,14 +607,16 @@ Then: Set `test_commands: []` and `test_framework: "none"`, skip `verify_testing
             print(f"⚠️  Warning: Could not save trajectory: {e}")
             # Continue anyway - trajectory save failure shouldn't block the pipeline
 
+        # The final report is collected and written to stdout in one go
         # Report final costs
         if hasattr(agent.model, "cost"):
-            print(f"💵 Total cost: ${agent.model.cost:.4f}")
+            report.append(f"💵 Total cost: ${agent.model.cost:.4f}")
         if hasattr(agent.model, "n_calls"):
-            print(f"📞 Total API calls: {agent.model.n_calls}")
+            report.append(f"📞 Total API calls: {agent.model.n_calls}")
 
         if timeout_occurred:
-            print("❌ Agent timed out - Dockerfile generation incomplete")
+            report.append("❌ Agent timed out - Dockerfile generation incomplete")
+            write_report(report)
             sys.exit(124)  # Exit code 124 indicates timeout (standard Unix convention)
 
         if is_python_repo:
@@ -494,91 +625,90 @@ Then: Set `test_commands: []` and `test_framework: "none"`, skip `verify_testing
             metadata_path = repo_result_dir / "repo_metadata.json"
 
             if len(sh_files) == 0:
-                print(
+                report.append(
                     "❌ No conda installation script (.sh file) was created. Check the agent output above."
                 )
-                print(f"Exit status: {exit_status}, Result: {result}")
+                report.append(f"Exit status: {exit_status}, Result: {result}")
             elif len(sh_files) > 1:
-                print(
+                report.append(
                     f"❌ Multiple .sh files found in {repo_result_dir}: {[f.name for f in sh_files]}"
                 )
-                print(
+                report.append(
                     "Expected exactly one installation script. Check the agent output above."
                 )
-                print(f"Exit status: {exit_status}, Result: {result}")
+                report.append(f"Exit status: {exit_status}, Result: {result}")
             else:
                 install_script_path = sh_files[0]
-                print(
+                report.append(
                     f"✅ Conda installation script successfully created at {install_script_path}"
                 )
-                print("\n🐍 Generated Conda Installation Script:")
-                print("-" * 50)
-                print(install_script_path.read_text())
-                print("-" * 50)
+                report.append("\n🐍 Generated Conda Installation Script:")
+                report.append("-" * 50)
+                report.append(install_script_path.read_text())
+                report.append("-" * 50)
 
                 # Check for metadata file
                 if metadata_path.exists():
-                    print(f"✅ Repository metadata file created at {metadata_path}")
-                    print("\n📊 Repository Metadata:")
-                    print("-" * 50)
-                    print(metadata_path.read_text())
-                    print("-" * 50)
+                    report.append(f"✅ Repository metadata file created at {metadata_path}")
+                    report.append("\n📊 Repository Metadata:")
+                    report.append("-" * 50)
+                    report.append(metadata_path.read_text())
+                    report.append("-" * 50)
                 else:
-                    print("⚠️  Warning: repo_metadata.json was not created by agent")
+                    report.append("⚠️  Warning: repo_metadata.json was not created by agent")
 
-                print(
+                report.append(
                     "🎉 Conda installation script generation completed successfully!"
                 )
-                print("📋 Script ready for SWE-smith try_install_py workflow:")
+                report.append("📋 Script ready for SWE-smith try_install_py workflow:")
 
                 # Try to extract commit hash from metadata for usage instructions
                 if metadata_path.exists():
                     try:
-                        with open(metadata_path, "r") as f:
-                            metadata = json.load(f)
-                            commit_hash = metadata.get("commit_hash", "<COMMIT_HASH>")
-                        print(
+                        metadata = load_json(metadata_path)
+                        commit_hash = metadata.get("commit_hash", "<COMMIT_HASH>")
+                        report.append(
                             f"   python -m swesmith.build_repo.try_install_py {repo_name} {install_script_path.absolute()} --commit {commit_hash}"
                         )
                     except:
-                        print(
+                        report.append(
                             f"   python -m swesmith.build_repo.try_install_py {repo_name} {install_script_path.absolute()} --commit <COMMIT_HASH>"
                         )
-                        print(
+                        report.append(
                             "   (Check repo_metadata.json for the actual commit hash)"
                         )
                 else:
-                    print(
+                    report.append(
                         f"   python -m swesmith.build_repo.try_install_py {repo_name} {install_script_path.absolute()} --commit <COMMIT_HASH>"
                     )
-                    print("   (Commit hash should be provided - check agent output)")
+                    report.append("   (Commit hash should be provided - check agent output)")
         else:
             # Check if Dockerfile was created
             dockerfile_path = repo_result_dir / "Dockerfile"
             metadata_path = repo_result_dir / "repo_metadata.json"
 
             if dockerfile_path.exists():
-                print(f"✅ Dockerfile successfully created at {dockerfile_path}")
-                print("\n📋 Generated Dockerfile:")
-                print("-" * 50)
-                print(dockerfile_path.read_text())
-                print("-" * 50)
+                report.append(f"✅ Dockerfile successfully created at {dockerfile_path}")
+                report.append("\n📋 Generated Dockerfile:")
+                report.append("-" * 50)
+                report.append(dockerfile_path.read_text())
+                report.append("-" * 50)
 
                 # Check for metadata file
                 if metadata_path.exists():
-                    print(f"✅ Repository metadata file created at {metadata_path}")
-                    print("\n📊 Repository Metadata:")
-                    print("-" * 50)
-                    print(metadata_path.read_text())
-                    print("-" * 50)
+                    report.append(f"✅ Repository metadata file created at {metadata_path}")
+                    report.append("\n📊 Repository Metadata:")
+                    report.append("-" * 50)
+                    report.append(metadata_path.read_text())
+                    report.append("-" * 50)
                 else:
-                    print("⚠️  Warning: repo_metadata.json was not created by agent")
+                    report.append("⚠️  Warning: repo_metadata.json was not created by agent")
                     # Try to extract from Dockerfile as fallback
                     extracted_commands = extract_test_command_from_dockerfile(
                         dockerfile_path
                     )
                     if extracted_commands:
-                        print("📋 Attempting to extract metadata from Dockerfile...")
+                        report.append("📋 Attempting to extract metadata from Dockerfile...")
                         # Convert to new format
                         metadata = {
                             "install_commands": ["unknown"],
@@ -591,55 +721,56 @@ Then: Set `test_commands: []` and `test_framework: "none"`, skip `verify_testing
                             ),
                             "commit_hash": "unknown",
                         }
-                        with open(metadata_path, "w") as f:
-                            json.dump(metadata, f, indent=2)
-                        print("✅ Created repo_metadata.json from Dockerfile analysis")
-                        print("\n📊 Extracted Repository Metadata:")
-                        print("-" * 50)
-                        print(json.dumps(metadata, indent=2))
-                        print("-" * 50)
+                        dump_json(metadata, metadata_path)
+                        report.append("✅ Created repo_metadata.json from Dockerfile analysis")
+                        report.append("\n📊 Extracted Repository Metadata:")
+                        report.append("-" * 50)
+                        report.append(json.dumps(metadata, indent=2))
+                        report.append("-" * 50)
                     else:
-                        print("❌ Could not extract metadata from Dockerfile")
+                        report.append("❌ Could not extract metadata from Dockerfile")
 
-                print("🎉 Dockerfile generation completed successfully!")
+                report.append("🎉 Dockerfile generation completed successfully!")
 
                 if verify_mode:
-                    print(
+                    report.append(
                         "\n💡 Note: The agent was instructed to verify the Dockerfile."
                     )
-                    print(
+                    report.append(
                         "   Check the trajectory above to see if verification passed."
                     )
 
                     if args.verify_testing:
-                        print(
+                        report.append(
                             "\n🧪 Note: The agent was also instructed to run verify_testing.py."
                         )
                         parsed_status_path = repo_result_dir / "parsed_test_status.json"
                         if parsed_status_path.exists():
-                            print(
+                            report.append(
                                 f"   ✅ Test parsing succeeded! Results saved to: {parsed_status_path}"
                             )
                             try:
-                                with open(parsed_status_path, "r") as f:
-                                    parsed_data = json.load(f)
-                                    parser_used = parsed_data.get("parser", "unknown")
-                                    test_count = len(
-                                        parsed_data.get("parsed_test_status", {})
-                                    )
-                                    print(f"   📊 Parser used: {parser_used}")
-                                    print(f"   📊 Tests parsed: {test_count}")
+                                parsed_data = load_json(parsed_status_path)
+                                parser_used = parsed_data.get("parser", "unknown")
+                                test_count = len(
+                                    parsed_data.get("parsed_test_status", {})
+                                )
+                                report.append(f"   📊 Parser used: {parser_used}")
+                                report.append(f"   📊 Tests parsed: {test_count}")
                             except:
                                 pass
                         else:
-                            print(
+                            report.append(
                                 "   ⚠️  Test parsing may have failed - check trajectory for details"
                             )
             else:
-                print("❌ No Dockerfile was created. Check the agent output above.")
-                print(f"Exit status: {exit_status}, Result: {result}")
+                report.append("❌ No Dockerfile was created. Check the agent output above.")
+                report.append(f"Exit status: {exit_status}, Result: {result}")
+
+        write_report(report)
 
     except Exception as e:
+        write_report(report)
         print(f"❌ Error running agent: {e}")
 
         # Still try to save trajectory if possible
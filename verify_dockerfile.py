@@ -1,11 +1,21 @@
 #!/usr/bin/env python3
+import codecs
+import hashlib
+import os
 import sys
 import subprocess
 import argparse
-import json
 from pathlib import Path
 from typing import Tuple, Optional
 import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from pipeline_io import PARSE_CACHE_PREFIX, load_json
+
+# Key of the last successful build, stored in the build context
+BUILD_CACHE_FILE = ".verify_cache"
+# Files written into the build context by this pipeline, not inputs to the build
+_GENERATED_FILES = frozenset({BUILD_CACHE_FILE, "test_output.txt", "parsed_test_status.json"})
 
 
 def run_command(
@@ -22,6 +32,11 @@ def run_command(
         return -1, f"Error running command: {e}"
 
 
+def _decode_output(data) -> str:
+    """Decode captured output with the newline translation of a text-mode pipe."""
+    return data.decode("utf-8", errors="replace").replace("\r\n", "\n").replace("\r", "\n")
+
+
 def run_command_with_progress(
     cmd: list, cwd: Optional[Path] = None, timeout: int = 600
 ) -> Tuple[int, str]:
@@ -31,16 +46,28 @@ def run_command_with_progress(
             cwd=cwd,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
-            universal_newlines=True,
+            bufsize=0,
         )
-        output_lines = []
+        output = bytearray()
 
         def read_output():
-            for line in process.stdout:
-                print(line, end="")
-                output_lines.append(line)
+            # Relay raw chunks instead of decoding and splitting every line
+            fd = process.stdout.fileno()
+            sys.stdout.flush()
+            # Text-only streams (e.g. io.StringIO) have no binary buffer
+            out = getattr(sys.stdout, "buffer", None)
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            while True:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    break
+                if out is not None:
+                    out.write(chunk)
+                    out.flush()
+                else:
+                    sys.stdout.write(decoder.decode(chunk))
+                    sys.stdout.flush()
+                output.extend(chunk)
 
         thread = threading.Thread(target=read_output)
         thread.start()
@@ -48,15 +75,31 @@ def run_command_with_progress(
             process.wait(timeout=timeout)
         except subprocess.TimeoutExpired:
             process.kill()
-            return -1, "".join(
-                output_lines
+            return -1, _decode_output(
+                bytes(output)
             ) + f"\nCommand timed out after {timeout} seconds"
         thread.join()
-        return process.returncode, "".join(output_lines)
+        return process.returncode, _decode_output(output)
     except Exception as e:
         return -1, f"Error running command: {e}"
 
 
+def build_context_key(repo_dir: Path, dockerfile_path: Path) -> str:
+    """Hash the Dockerfile contents plus the path, size and mtime of every context file."""
+    digest = hashlib.sha256(dockerfile_path.read_bytes())
+    for file_path in sorted(repo_dir.rglob("*")):
+        relative = file_path.relative_to(repo_dir).as_posix()
+        if (
+            relative in _GENERATED_FILES
+            or file_path.name.startswith(PARSE_CACHE_PREFIX)
+            or not file_path.is_file()
+        ):
+            continue
+        stat = file_path.stat()
+        digest.update(f"{relative}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--python-repo", action="store_true")
@@ -66,6 +109,7 @@ def main():
     parser.add_argument("--allow-test-failures", action="store_true")
     parser.add_argument("--failure-threshold", type=float, default=0.0)
     parser.add_argument("--timeout", type=int, default=600)
+    parser.add_argument("--force-build", action="store_true")
     parser.add_argument("path")
     args = parser.parse_args()
 
@@ -83,33 +127,64 @@ def main():
         repo_dir = dockerfile_path.parent
 
     metadata_path = repo_dir / "repo_metadata.json"
-    with open(metadata_path, "r") as f:
-        metadata = json.load(f)
+    metadata = load_json(metadata_path)
 
     image_name = f"{metadata['repo']}-verification-test".lower()
-    print("Building Docker image...")
-    build_cmd = [
-        "docker",
-        "build",
-        "-t",
-        image_name,
-        "-f",
-        str(dockerfile_path.name),
-        ".",
-    ]
-    ret, out = run_command_with_progress(build_cmd, cwd=repo_dir, timeout=args.timeout)
-    if ret != 0:
-        print("Build failed")
-        sys.exit(1)
+
+    # Skip the build when neither the Dockerfile nor the build context changed
+    # since the last successful build and that image still exists. The plain
+    # tag is shared by every result dir for this repo, so builds are also
+    # tagged with their key and tests run against that exact reference.
+    cache_path = repo_dir / BUILD_CACHE_FILE
+    context_key = build_context_key(repo_dir, dockerfile_path)
+    keyed_image = f"{image_name}:{context_key}"
+    if (
+        not args.force_build
+        and cache_path.exists()
+        and cache_path.read_text().strip() == context_key
+        and run_command(["docker", "image", "inspect", keyed_image])[0] == 0
+    ):
+        print("Docker image is up to date, skipping build")
+    else:
+        print("Building Docker image...")
+        build_cmd = [
+            "docker",
+            "build",
+            "-t",
+            image_name,
+            "-t",
+            keyed_image,
+            "-f",
+            str(dockerfile_path.name),
+            ".",
+        ]
+        cache_path.unlink(missing_ok=True)
+        ret, out = run_command_with_progress(build_cmd, cwd=repo_dir, timeout=args.timeout)
+        if ret != 0:
+            print("Build failed")
+            sys.exit(1)
+        cache_path.write_text(context_key)
 
     print("Running tests...")
     test_results = []
-    with open(repo_dir / "test_output.txt", "w") as f:
-        for cmd_str in metadata.get("test_commands", []):
+    test_commands = metadata.get("test_commands", [])
+    # Each command gets its own container, so they can run side by side;
+    # output is still written in command order. A single long-lived container
+    # with "docker exec" per command would save the repeated start-up, but the
+    # commands would then have to run one after another (they would race on a
+    # shared filesystem) and could see each other's leftovers; with parallel
+    # containers the start-up cost overlaps instead.
+    with open(repo_dir / "test_output.txt", "w") as f, ThreadPoolExecutor(
+        max_workers=max(1, min(len(test_commands), os.cpu_count() or 1))
+    ) as executor:
+        futures = []
+        for cmd_str in test_commands:
             print(f"Running test: {cmd_str}")
             # Pass complex shell commands to sh -c
-            docker_cmd = ["docker", "run", "--rm", image_name, "sh", "-c", cmd_str]
-            ret, out = run_command(docker_cmd, timeout=args.timeout)
+            docker_cmd = ["docker", "run", "--rm", keyed_image, "sh", "-c", cmd_str]
+            futures.append(executor.submit(run_command, docker_cmd, timeout=args.timeout))
+        for future in futures:
+            ret, out = future.result()
             f.write(out)
             test_results.append(out)
 
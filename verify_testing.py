@@ -21,13 +21,39 @@ Usage:
     python verify_testing.py path/to/Dockerfile               # For non-Python repos
 """
 
+import hashlib
 import json
+import mmap
+import os
+import re
 import sys
 from log_parser.parsers.phaser_custom import parse_log_phaser_custom
 import argparse
+import copy
+import functools
+from collections import Counter
+from itertools import islice
+from json.encoder import encode_basestring
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+try:
+    # Optional faster JSON writer (pip install orjson)
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 # Import parsers from existing log_parser
 from log_parser.parsers.jest import parse_log_jest
 from log_parser.parsers.mocha import parse_log_mocha
@@ -44,9 +70,12 @@ from log_parser.parsers.cspell import parse_log_cspell
 from log_parser.parsers.stylelint import parse_log_stylelint
 from log_parser.parsers.eslint import parse_log_eslint
 from log_parser.parsers.ospec import parse_log_ospec
+from pipeline_io import PARSE_CACHE_PREFIX, dump_json, load_json, write_report
 
 
-# Parser registry
+# Parser registry. Every parser is run against the same log on each call, so
+# parser modules compile their regexes once at import as module-level
+# constants rather than passing pattern strings to re.match/re.search.
 PARSERS = {
     "easy_rules_custom": parse_log_easy_rules_custom,
     "testng": parse_log_testng_ant,
@@ -79,6 +108,118 @@ PARSERS = {
     "cppunit": parse_log_cppunit,
 }
 
+# Literals at least one of which must appear in the log for the parser to
+# return anything. Parsers without an entry (case-insensitive matching, ANSI
+# stripping before matching, or very generic line patterns) are always tried.
+# All literals are found in one shared pass. The parsers' own line patterns are
+# deliberately not fused into one alternation regex: finditer reports only one
+# alternative per position, so a line that several parsers match would reach
+# only one of them.
+PARSER_SIGNATURES = {
+    "easy_rules_custom": ("Tests run: ",),
+    "testng": ("[testng]",),
+    "phaser_custom": (
+        "=== Command 1: npm run tsgen ===",
+        "=== Command 2: npm run test-ts ===",
+    ),
+    "grasscutter_custom": ("Task :test", "BUILD FAILED"),
+    "jest": ("✓", "✕", "○", "PASS", "FAIL", "SKIP", "Tests:"),
+    "pytest": ("PASSED", "FAILED", "SKIPPED", "ERROR"),
+    "go_test": ("PASS:", "FAIL:", "SKIP:"),
+    "cargo": ("...",),
+    "lodash_custom": ("PASS:",),
+    "karma": ("Executed",),
+    "jasmine": ("Executed",),
+    "cspell": (
+        "All matched files use Prettier code style!",
+        "Checking formatting...",
+        "test:build",
+        "CSpell: Files checked: ",
+    ),
+    "eslint": ("✖ ", "npm info ok", "exit 0"),
+    "ospec": ("assertions passed", "assertions failed"),
+}
+
+
+_SIGNATURE_LITERALS = sorted({s for sigs in PARSER_SIGNATURES.values() for s in sigs})
+
+# Parsers that own a log outright: when one of these is the first to produce at
+# least the given number of results, the remaining candidates are not tried.
+# Python logs come from pytest alone, and a Java build runs under exactly one
+# of Gradle, Maven or Ant/JUnit.
+EXCLUSIVE_PARSERS = {
+    "pytest": 1,
+    "gradle": 1,
+    "maven": 1,
+    "junit": 1,
+}
+
+
+def _build_signature_database():
+    """Compile every signature literal into one Hyperscan block-mode database."""
+    if hyperscan is None:
+        return None
+    database = hyperscan.Database()
+    count = len(_SIGNATURE_LITERALS)
+    database.compile(
+        expressions=[re.escape(s).encode("utf-8") for s in _SIGNATURE_LITERALS],
+        ids=list(range(count)),
+        elements=count,
+        # Presence is all that matters, so stop reporting a literal after its
+        # first match
+        flags=[hyperscan.HS_FLAG_SINGLEMATCH] * count,
+    )
+    return database
+
+
+def _build_signature_scanner():
+    """Build one automaton that finds every signature literal in a single pass."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for literal in _SIGNATURE_LITERALS:
+        automaton.add_word(literal, literal)
+    automaton.make_automaton()
+    return automaton
+
+
+_SIGNATURE_DATABASE = _build_signature_database()
+_SIGNATURE_SCANNER = None if _SIGNATURE_DATABASE else _build_signature_scanner()
+
+
+def find_signatures(log_content: str, log_buffer=None) -> set:
+    """
+    Return the PARSER_SIGNATURES literals that occur in the log.
+
+    log_buffer may hold the raw bytes of the same log (e.g. the mapped
+    test_output.txt); the Hyperscan backend scans it instead of re-encoding
+    log_content.
+    """
+    if _SIGNATURE_DATABASE is not None:
+        found = set()
+
+        def on_match(literal_id, start, end, flags, context):
+            found.add(_SIGNATURE_LITERALS[literal_id])
+
+        # UTF-8 is self-synchronizing and no literal contains a line ending,
+        # so a literal occurs in the raw bytes exactly when it occurs in the
+        # decoded, newline-translated log
+        if log_buffer is not None:
+            try:
+                _SIGNATURE_DATABASE.scan(log_buffer, match_event_handler=on_match)
+                return found
+            except TypeError:
+                # This hyperscan build only accepts bytes objects
+                pass
+        _SIGNATURE_DATABASE.scan(
+            log_content.encode("utf-8"), match_event_handler=on_match
+        )
+        return found
+    if _SIGNATURE_SCANNER is not None:
+        return {literal for _, literal in _SIGNATURE_SCANNER.iter(log_content)}
+    return {literal for literal in _SIGNATURE_LITERALS if literal in log_content}
+
+
 # Language to framework mappings
 LANGUAGE_FRAMEWORKS = {
     "javascript": [
@@ -103,6 +244,23 @@ LANGUAGE_FRAMEWORKS = {
     "cpp": ["ctest", "ctest_gtest", "gtest", "catch", "catch2", "boost_test", "cppunit"],
 }
 
+# LANGUAGE_FRAMEWORKS with duplicates dropped, built once at import
+PRIORITY_ORDER = {
+    language: tuple(dict.fromkeys(frameworks))
+    for language, frameworks in LANGUAGE_FRAMEWORKS.items()
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _load_metadata(path_str: str, mtime_ns: int) -> Dict:
+    """Parse a metadata file once per (path, mtime); callers get a deep copy."""
+    return load_json(Path(path_str))
+
+
+def load_metadata(path: Path) -> Dict:
+    """Load a metadata JSON file, reusing the parse while the file is unchanged."""
+    return copy.deepcopy(_load_metadata(str(path), path.stat().st_mtime_ns))
+
 
 def load_repo_metadata(directory: Path) -> Optional[Dict]:
     """Load repo_metadata.json from directory."""
@@ -113,8 +271,7 @@ def load_repo_metadata(directory: Path) -> Optional[Dict]:
         return None
 
     try:
-        with open(metadata_path, "r") as f:
-            return json.load(f)
+        return load_metadata(metadata_path)
     except (json.JSONDecodeError, IOError) as e:
         print(f"Error reading repo_metadata.json: {e}")
         return None
@@ -128,15 +285,31 @@ def load_test_commands_legacy(directory: Path) -> Optional[Dict]:
         return None
 
     try:
-        with open(test_commands_path, "r") as f:
-            return json.load(f)
+        return load_metadata(test_commands_path)
     except (json.JSONDecodeError, IOError) as e:
         print(f"Warning: Error reading legacy test_commands.json: {e}")
         return None
 
 
+def load_test_output_mmap(test_output_path: Path) -> Optional[mmap.mmap]:
+    """Map test_output.txt read-only; returns None for an empty file."""
+    with open(test_output_path, "rb") as f:
+        # mmap cannot map an empty file
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        # The mapping stays valid after the file object is closed
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
 def load_test_output(directory: Path) -> Optional[str]:
-    """Load test_output.txt from directory."""
+    """
+    Load test_output.txt from directory.
+
+    The whole log is always loaded rather than just its tail: most parsers
+    emit one entry per test line found anywhere in the output, and any
+    non-empty result is accepted, so parsing only the last part of a log would
+    silently drop the earlier tests instead of falling back to a full scan.
+    """
     test_output_path = directory / "test_output.txt"
 
     if not test_output_path.exists():
@@ -145,39 +318,121 @@ def load_test_output(directory: Path) -> Optional[str]:
         return None
 
     try:
-        with open(test_output_path, "r", encoding="utf-8", errors="replace") as f:
-            return f.read()
+        mm = load_test_output_mmap(test_output_path)
+        if mm is None:
+            return ""
+        # Decode straight from the mapped pages instead of first copying
+        # the whole log into a bytes object on the heap
+        with mm:
+            log_content = str(mm, "utf-8", "replace")
     except IOError as e:
         print(f"Error reading test_output.txt: {e}")
         return None
 
+    # Same newline translation a text-mode read applies
+    if "\r" in log_content:
+        log_content = log_content.replace("\r\n", "\n").replace("\r", "\n")
+    return log_content
+
+
+# Smaller logs are parsed serially; starting worker processes would cost more
+PARALLEL_MIN_LOG_SIZE = 64 * 1024
+
+# Log handed to each worker process once, instead of pickled per parser
+_worker_log_content = None
+
+
+def _init_parser_worker(log_content: str) -> None:
+    global _worker_log_content
+    _worker_log_content = log_content
+
+
+def _run_parser_in_worker(parser_func) -> Dict[str, str]:
+    return parser_func(_worker_log_content)
+
 
 def try_parsers(
-    log_content: str, parser_names: List[str]
+    log_content: str, parser_names: List[str], signatures: Optional[set] = None
 ) -> Optional[Tuple[Dict[str, str], str]]:
     """
     Try multiple parsers and combine results from all that produce output.
     This allows handling test output from multiple frameworks in a single file.
+
+    For large logs the parsers run concurrently in worker processes; results
+    are still combined and reported in parser_names order.
+
+    Parsers whose PARSER_SIGNATURES literals are all absent from the log are
+    skipped, since they could not have produced any results. Pass signatures
+    (from find_signatures) to reuse an earlier scan of the same log.
+
+    If the first parser to produce results is listed in EXCLUSIVE_PARSERS with
+    enough results, its output is returned without trying the rest.
     """
     combined_results = {}
     successful_parsers = []
+    # Several registry names alias the same function (e.g. karma/jasmine)
+    results_by_func = {}
+
+    found = find_signatures(log_content) if signatures is None else signatures
+    parser_names = [
+        name
+        for name in parser_names
+        if name in PARSERS
+        and (
+            name not in PARSER_SIGNATURES
+            or not found.isdisjoint(PARSER_SIGNATURES[name])
+        )
+    ]
+    parser_funcs = list(dict.fromkeys(PARSERS[name] for name in parser_names))
+    workers = min(len(parser_funcs), os.cpu_count() or 1)
+    futures = {}
+    executor = None
+    stopped_early = False
+    if workers > 1 and len(log_content) >= PARALLEL_MIN_LOG_SIZE:
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_parser_worker,
+            initargs=(log_content,),
+        )
+        futures = {
+            func: executor.submit(_run_parser_in_worker, func) for func in parser_funcs
+        }
 
-    for parser_name in parser_names:
-        if parser_name not in PARSERS:
-            continue
-
-        parser_func = PARSERS[parser_name]
-        try:
-            result = parser_func(log_content)
-            if result:  # Parser returned some results
-                print(
-                    f"Successfully parsed with {parser_name} parser ({len(result)} tests)"
-                )
-                combined_results.update(result)
-                successful_parsers.append(parser_name)
-        except Exception as e:
-            print(f"Parser {parser_name} failed with error: {e}")
-            continue
+    try:
+        # parser_names was narrowed to registered parsers above
+        for parser_name in parser_names:
+            parser_func = PARSERS[parser_name]
+            try:
+                if parser_func in results_by_func:
+                    result = results_by_func[parser_func]
+                elif parser_func in futures:
+                    result = results_by_func[parser_func] = futures[parser_func].result()
+                else:
+                    result = results_by_func[parser_func] = parser_func(log_content)
+                if result:  # Parser returned some results
+                    print(
+                        f"Successfully parsed with {parser_name} parser ({len(result)} tests)"
+                    )
+                    combined_results.update(result)
+                    successful_parsers.append(parser_name)
+                    if (
+                        len(successful_parsers) == 1
+                        and parser_name in EXCLUSIVE_PARSERS
+                        and len(result) >= EXCLUSIVE_PARSERS[parser_name]
+                    ):
+                        stopped_early = True
+                        break
+            except Exception as e:
+                print(f"Parser {parser_name} failed with error: {e}")
+                continue
+    finally:
+        if executor is not None:
+            if stopped_early:
+                # Stop parsers still running after an exclusive hit; otherwise
+                # shutdown (or interpreter exit) waits for them to finish
+                for process in list(executor._processes.values()):
+                    process.terminate()
+            executor.shutdown(cancel_futures=True)
 
     if combined_results:
         parser_names_str = "+".join(successful_parsers)
@@ -186,10 +441,134 @@ def try_parsers(
     return None
 
 
+# Per-language counts of which parsers produced results, used by --adaptive to
+# try the historically successful parsers first
+PRIORS_PATH = Path.home() / ".cache" / "verify_testing" / "priors.json"
+
+
+def load_priors() -> Dict[str, Dict[str, int]]:
+    """Load parser hit counts; an unreadable or missing file counts as empty."""
+    if not PRIORS_PATH.exists():
+        return {}
+
+    try:
+        return load_json(PRIORS_PATH)
+    except (json.JSONDecodeError, IOError):
+        return {}
+
+
+def record_parser_hits(language: str, parser_name: str) -> None:
+    """Count a success for each parser in a combined "a+b" parser name."""
+    priors = load_priors()
+    language_priors = priors.setdefault(language, {})
+    for name in parser_name.split("+"):
+        language_priors[name] = language_priors.get(name, 0) + 1
+
+    try:
+        PRIORS_PATH.parent.mkdir(parents=True, exist_ok=True)
+        # Write a sibling file and swap it in, so concurrent runs never read a
+        # half-written priors file
+        tmp_path = PRIORS_PATH.with_name(f"{PRIORS_PATH.name}.{os.getpid()}.tmp")
+        dump_json(priors, tmp_path)
+        os.replace(tmp_path, PRIORS_PATH)
+    except IOError as e:
+        print(f"Warning: Error saving parser priors: {e}")
+
+
+# Earlier parse results (PARSE_CACHE_PREFIX files) are keyed by the log
+# content, the parser-selection metadata and the parser sources
+
+# One shared object per status, so results read back from the cache hold a
+# pointer per test rather than a freshly decoded string
+_STATUS_VALUES = {status: status for status in ("PASSED", "FAILED", "SKIPPED")}
+
+
+@functools.lru_cache(maxsize=None)
+def _parser_code_digest() -> bytes:
+    """Hash the parser sources and this script, so editing a parser invalidates caches."""
+    digest = hashlib.blake2b(digest_size=16)
+    parsers_dir = Path(parse_log_jest.__code__.co_filename).parent
+    for source in [*sorted(parsers_dir.glob("*.py")), Path(__file__)]:
+        digest.update(f"{source.name}\0".encode("utf-8"))
+        digest.update(source.read_bytes())
+    return digest.digest()
+
+
+def parse_cache_key(directory: Path, test_framework: str, language: str) -> str:
+    """
+    Hash test_output.txt together with the metadata that steers parser
+    selection and the parser code that produced the result.
+    """
+    digest = hashlib.blake2b(_parser_code_digest(), digest_size=16)
+    log_buffer = load_test_output_mmap(directory / "test_output.txt")
+    if log_buffer is not None:
+        with log_buffer:
+            digest.update(log_buffer)
+    digest.update(f"\0{test_framework}\0{language}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def load_parse_cache(cache_path: Path) -> Optional[Tuple[Dict[str, str], str]]:
+    """Return a cached (result, parser_name), or None on a miss or unreadable cache."""
+    if not cache_path.exists():
+        return None
+
+    try:
+        cached = load_json(cache_path)
+        result = {
+            name: _STATUS_VALUES.get(status, status)
+            for name, status in cached["parsed_test_status"].items()
+        }
+        return result, cached["parser"]
+    except (json.JSONDecodeError, IOError, KeyError, TypeError):
+        return None
+
+
+def save_parse_cache(
+    cache_path: Path, result: Dict[str, str], parser_name: str
+) -> None:
+    """Store a parse result, replacing caches left by earlier logs."""
+    try:
+        for stale in cache_path.parent.glob(f"{PARSE_CACHE_PREFIX}*.json"):
+            stale.unlink(missing_ok=True)
+        cached = {"parser": parser_name, "parsed_test_status": result}
+        if orjson is not None:
+            cache_path.write_bytes(orjson.dumps(cached))
+        else:
+            with open(cache_path, "w", encoding="utf-8") as f:
+                json.dump(cached, f, ensure_ascii=False)
+    except IOError as e:
+        print(f"Warning: Error saving parse cache: {e}")
+
+
+def _stream_parsed_result(f, result: Dict[str, str], parser_name: str) -> None:
+    """
+    Write parsed_test_status.json one test entry at a time.
+
+    Produces the same text as json.dump(indent=2, ensure_ascii=False) for this
+    fixed schema, without going through json's pure-Python indenting encoder.
+    """
+    f.write(f'{{\n  "parser": {encode_basestring(parser_name)},\n')
+    f.write('  "parsed_test_status": ')
+    if not result:
+        f.write("{}\n}")
+        return
+    f.write("{")
+    f.writelines(
+        f"{',' if i else ''}\n    {encode_basestring(name)}: {encode_basestring(status)}"
+        for i, (name, status) in enumerate(result.items())
+    )
+    f.write("\n  }\n}")
+
+
 def save_parsed_result(
-    result: Dict[str, str], parser_name: str, directory: Path
+    result: Dict[str, str], parser_name: str, directory: Path, compact: bool = False
 ) -> None:
-    """Save parsed test results to parsed_test_status.json."""
+    """
+    Save parsed test results to parsed_test_status.json.
+
+    compact writes minified JSON instead of the default two-space indentation.
+    """
     output_path = directory / "parsed_test_status.json"
 
     output_data = {
@@ -198,15 +577,26 @@ def save_parsed_result(
     }
 
     try:
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            # Same layouts as the stdlib writers below
+            option = None if compact else orjson.OPT_INDENT_2
+            output_path.write_bytes(orjson.dumps(output_data, option=option))
+        elif compact:
+            with open(output_path, "w", encoding="utf-8") as f:
+                json.dump(output_data, f, separators=(",", ":"), ensure_ascii=False)
+        else:
+            with open(output_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+                _stream_parsed_result(f, result, parser_name)
         print(f"Saved parsed test results to: {output_path}")
     except IOError as e:
         print(f"Error saving parsed test results: {e}")
 
 
 def parse_test_output(
-    directory: Path, is_python_repo: bool = False
+    directory: Path,
+    is_python_repo: bool = False,
+    use_cache: bool = True,
+    adaptive: bool = False,
 ) -> Optional[Tuple[Dict[str, str], str]]:
     """
     Main parsing function for both Python and non-Python repos.
@@ -214,6 +604,8 @@ def parse_test_output(
     Args:
         directory: Directory containing repo_metadata.json, test_output.txt
         is_python_repo: Whether this is a Python repository
+        use_cache: Reuse the result of an earlier parse of the same log
+        adaptive: Order language-based parsers by their recorded hit counts
 
     Returns:
         Tuple of (Dictionary mapping test case names to status, parser_name)
@@ -270,6 +662,31 @@ def parse_test_output(
         )
         language = "python"
 
+    # Reuse an earlier parse of the same log and metadata
+    cache_path = None
+    if use_cache:
+        cache_key = parse_cache_key(directory, test_framework, language)
+        cache_path = directory / f"{PARSE_CACHE_PREFIX}{cache_key}.json"
+        cached = load_parse_cache(cache_path)
+        if cached:
+            print(f"♻️  test_output.txt unchanged, reusing cached parse: {cache_path}")
+            return cached
+
+    # Scan for parser signatures once, for both the priority and fallback
+    # passes below. Hyperscan matches bytes, so it reads the mapped file
+    # rather than a re-encoded copy of the decoded log. This is also the
+    # no-tests pre-filter: a log with none of a parser's literals never reaches
+    # it, while parsers that can report tests without fixed markers (mocha's
+    # checkmarks, karma's SUCCESS, cargo's "ok") are still tried.
+    log_buffer = None
+    if _SIGNATURE_DATABASE is not None:
+        log_buffer = load_test_output_mmap(directory / "test_output.txt")
+    try:
+        signatures = find_signatures(log_content, log_buffer)
+    finally:
+        if log_buffer is not None:
+            log_buffer.close()
+
     # Step 5: Try all relevant parsers and combine results
     print("🧪 Starting parser selection...")
 
@@ -282,12 +699,16 @@ def parse_test_output(
         print(f"   Will try framework-specific parser: {test_framework}")
 
     # Priority 2: Language-based parsers
-    if language in LANGUAGE_FRAMEWORKS:
-        framework_list = LANGUAGE_FRAMEWORKS[language]
+    if language in PRIORITY_ORDER:
+        framework_list = PRIORITY_ORDER[language]
+        if adaptive:
+            # Stable sort: parsers with equal counts keep the static order
+            language_priors = load_priors().get(language, {})
+            framework_list = sorted(
+                framework_list, key=lambda f: -language_priors.get(f, 0)
+            )
         # Add language frameworks, avoiding duplicates
-        for framework in framework_list:
-            if framework not in parsers_to_try:
-                parsers_to_try.append(framework)
+        parsers_to_try = list(dict.fromkeys([*parsers_to_try, *framework_list]))
         print(
             f"   Will try language-based parsers for {language}: {[f for f in framework_list if f not in [test_framework]]}"
         )
@@ -295,22 +716,30 @@ def parse_test_output(
     # Try all relevant parsers at once (they'll combine results)
     if parsers_to_try:
         print(f"   Trying parsers: {parsers_to_try}")
-        parser_result = try_parsers(log_content, parsers_to_try)
+        parser_result = try_parsers(log_content, parsers_to_try, signatures)
         if parser_result:
             result, parser_name = parser_result
             print(f"✅ Successfully parsed with: {parser_name}")
+            if cache_path is not None:
+                save_parse_cache(cache_path, result, parser_name)
+            if adaptive:
+                record_parser_hits(language, parser_name)
             return result, parser_name
 
     # Priority 3: Try all remaining parsers as fallback
-    all_parsers = list(PARSERS.keys())
-    untried_parsers = [p for p in all_parsers if p not in parsers_to_try]
+    tried = set(parsers_to_try)
+    untried_parsers = [p for p in PARSERS if p not in tried]
 
     if untried_parsers:
         print(f"   Trying remaining parsers as fallback: {untried_parsers}")
-        parser_result = try_parsers(log_content, untried_parsers)
+        parser_result = try_parsers(log_content, untried_parsers, signatures)
         if parser_result:
             result, parser_name = parser_result
             print(f"✅ Successfully parsed with fallback parser: {parser_name}")
+            if cache_path is not None:
+                save_parse_cache(cache_path, result, parser_name)
+            if adaptive:
+                record_parser_hits(language, parser_name)
             return result, parser_name
         print("   No fallback parsers produced results")
 
@@ -343,6 +772,23 @@ def main():
         default=0.09,
         help="Maximum fraction of tests allowed to fail (default: 0.09 = 9%%)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-parse test_output.txt even if an earlier result for it is cached",
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Write parsed_test_status.json without indentation "
+        "(smaller for large test suites)",
+    )
+    parser.add_argument(
+        "--adaptive",
+        action="store_true",
+        help="Try the parsers that most often succeeded for this language first "
+        f"(counts kept in {PRIORS_PATH})",
+    )
 
     args = parser.parse_args()
 
@@ -361,39 +807,51 @@ def main():
     print(f"📂 Working directory: {directory}")
 
     # Parse test output
-    parse_result = parse_test_output(directory, args.python_repo)
+    parse_result = parse_test_output(
+        directory,
+        args.python_repo,
+        use_cache=not args.no_cache,
+        adaptive=args.adaptive,
+    )
 
     if parse_result:
         result, parser_name = parse_result
 
         # Summary
         total = len(result)
-        passed = sum(1 for status in result.values() if status == "PASSED")
-        failed = sum(1 for status in result.values() if status == "FAILED")
-        skipped = sum(1 for status in result.values() if status == "SKIPPED")
-
-        print("\n📊 Parsing Summary:")
-        print(f"   Parser used: {parser_name}")
-        print(f"   Total tests: {total}")
-        print(f"   Passed: {passed}")
-        print(f"   Failed: {failed}")
-        print(f"   Skipped: {skipped}")
+        # Counter tallies in C in one pass; converting the values for numpy
+        # would itself need a Python-level pass over every status first
+        status_counts = Counter(result.values())
+        passed = status_counts["PASSED"]
+        failed = status_counts["FAILED"]
+        skipped = status_counts["SKIPPED"]
+
+        # Buffer the summary and write it out in one go
+        report = [
+            "\n📊 Parsing Summary:",
+            f"   Parser used: {parser_name}",
+            f"   Total tests: {total}",
+            f"   Passed: {passed}",
+            f"   Failed: {failed}",
+            f"   Skipped: {skipped}",
+        ]
 
         # Show sample test results
         if total > 0:
-            print("\n🧪 Sample Test Results (first 5):")
-            items = list(result.items())
-            for i, (test_name, status) in enumerate(items[:5]):
+            report.append("\n🧪 Sample Test Results (first 5):")
+            for test_name, status in islice(result.items(), 5):
                 status_icon = (
                     "✅" if status == "PASSED" else "❌" if status == "FAILED" else "⏭️"
                 )
-                print(f"   {status_icon} {test_name}: {status}")
+                report.append(f"   {status_icon} {test_name}: {status}")
 
             if total > 5:
-                print(f"   ... and {total - 5} more tests")
+                report.append(f"   ... and {total - 5} more tests")
+
+        write_report(report)
 
         # Save parsed results
-        save_parsed_result(result, parser_name, directory)
+        save_parsed_result(result, parser_name, directory, compact=args.compact)
 
         print("\n🎉 Test parsing completed successfully!")
 